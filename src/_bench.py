@@ -0,0 +1,20 @@
+# src/_bench.py
+"""
+Lightweight phase timing for pipeline stages.
+Records wall-clock durations per phase so regressions in the hot path
+(JSON parse, graph build, clustering, layout, I/O) are visible in MLflow.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+@contextmanager
+def timed(label: str, timings: Dict[str, float]) -> Iterator[None]:
+    """Record the duration of the enclosed block, in seconds, as timings[label]."""
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings[label] = (time.perf_counter_ns() - start) / 1e9
@@ -1,11 +1,44 @@
 # src/cluster_analysis.py
 
-import json
+import contextlib
+import csv
+import functools
+import hashlib
+import os
+import random
+import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
 
-import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
+
+from src._bench import timed
+from src.mlflow_ctx import get_run
+from src.utils import dump_json, file_key, load_json, plots_enabled
+
+# Graphs larger than this are not rendered: the layout dominates runtime and
+# thousands of labels are unreadable anyway.
+VIS_NODE_LIMIT = 2000
+
+# Louvain partitions and layouts are cached here, next to the stats output,
+# keyed by a hash of the glossary and link dictionary contents.
+CACHE_DIR_NAME = ".louvain_cache"
+# Previous run's partition and edges, used to warm-start the next run
+LAST_PARTITION_NAME = "last_partition.json"
+# Above this fraction of changed terms, re-cluster the whole graph
+INCREMENTAL_MAX_CHANGE = 0.05
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is an optional speedup
+    ijson = None
+
+try:
+    import igraph
+except ImportError:  # pragma: no cover - igraph is an optional speedup
+    igraph = None
 
 
 # ---------------------------------------------------------------------------
@@ -13,69 +46,367 @@ import networkx as nx
 # ---------------------------------------------------------------------------
 
 
-def build_graph(glossary_json: str, link_dict_json: str) -> nx.DiGraph:
+def _extract_terms(glossary_raw) -> List[str]:
+    """
+    Extract term names from an already-parsed glossary in either format.
+    """
+    if isinstance(glossary_raw, dict):
+        # Format: {"AI": "...", "ML": "..."}
+        return list(glossary_raw.keys())
+    if isinstance(glossary_raw, list):
+        # Format: [{"term": "AI", ...}, {"term": "ML", ...}]
+        return [entry.get("term") for entry in glossary_raw if entry.get("term")]
+    raise ValueError("Unsupported glossary format")
+
+
+def _read_terms(glossary_path: Path) -> List[str]:
+    """
+    Read only the term names from a glossary file.
+
+    With ijson available the file is streamed, so the full glossary is never
+    materialized in memory; otherwise the whole document is parsed.
     """
-    Build a directed graph from glossary terms and link dictionary.
+    if ijson is None:
+        return _extract_terms(load_json(glossary_path))
+
+    with glossary_path.open("rb") as f:
+        events = ijson.parse(f)
+        _, first_event, _ = next(events)
+
+        if first_event == "start_map":
+            # Format: {"AI": "...", "ML": "..."}
+            return [
+                value
+                for prefix, event, value in events
+                if prefix == "" and event == "map_key"
+            ]
+        if first_event == "start_array":
+            # Format: [{"term": "AI", ...}, {"term": "ML", ...}]
+            return [
+                value
+                for prefix, event, value in events
+                if prefix == "item.term" and event == "string" and value
+            ]
+
+    raise ValueError("Unsupported glossary format")
+
+
+def build_graph(
+    glossary_json: str, link_dict_json: str, *, directed: bool = True
+) -> nx.Graph:
+    """
+    Build a graph from glossary terms and link dictionary.
 
     Supports BOTH glossary formats required by the test suite:
     1. List of {"term": "...", "definition": "..."}
     2. Dict of term -> definition
-    """
-    glossary_path = Path(glossary_json)
-    link_dict_path = Path(link_dict_json)
 
-    glossary_raw = json.loads(glossary_path.read_text(encoding="utf-8"))
-    link_dict: Dict[str, List[str]] = json.loads(
-        link_dict_path.read_text(encoding="utf-8")
+    Returns a DiGraph by default, or an undirected Graph with directed=False.
+
+    Results are cached on each input file's path, mtime and size, so repeated
+    calls within a pipeline run skip the JSON parse and graph build. The
+    returned graph is shared and frozen; call .copy() before mutating it.
+    """
+    return _build_graph_cached(
+        file_key(glossary_json), file_key(link_dict_json), directed
     )
 
-    G = nx.DiGraph()
 
-    # ------------------------------------------------------------
-    # Extract terms from either glossary format
-    # ------------------------------------------------------------
-    terms = []
+@functools.lru_cache(maxsize=4)
+def _build_graph_cached(
+    glossary_key: Tuple[str, int, int],
+    link_dict_key: Tuple[str, int, int],
+    directed: bool,
+) -> nx.Graph:
+    terms = _read_terms(Path(glossary_key[0]))
+    link_dict = load_json(Path(link_dict_key[0]))
+    return nx.freeze(_graph_from_terms(terms, link_dict, directed))
 
-    if isinstance(glossary_raw, dict):
-        # Format: {"AI": "...", "ML": "..."}
-        terms = list(glossary_raw.keys())
 
-    elif isinstance(glossary_raw, list):
-        # Format: [{"term": "AI", ...}, {"term": "ML", ...}]
-        for entry in glossary_raw:
-            term = entry.get("term")
-            if term:
-                terms.append(term)
+def build_graph_from_dict(
+    glossary_dict: Dict[str, object],
+    link_dict: Dict[str, List[str]],
+    *,
+    directed: bool = True,
+) -> nx.Graph:
+    """
+    Build a graph from an already-parsed dict-format glossary (term -> entry).
+    """
+    return _graph_from_terms(list(glossary_dict), link_dict, directed)
+
+
+def build_graph_from_list(
+    glossary_list: List[Dict[str, str]],
+    link_dict: Dict[str, List[str]],
+    *,
+    directed: bool = True,
+) -> nx.Graph:
+    """
+    Build a graph from an already-parsed list-format glossary
+    ([{"term": ..., "definition": ...}, ...]).
+    """
+    terms = [entry.get("term") for entry in glossary_list if entry.get("term")]
+    return _graph_from_terms(terms, link_dict, directed)
+
 
-    else:
-        raise ValueError("Unsupported glossary format")
+def _graph_from_terms(
+    terms: List[str], link_dict: Dict[str, List[str]], directed: bool
+) -> nx.Graph:
+    """
+    Shared graph builder: one node per term, one edge per link between terms.
+    """
+    # Intern terms so repeated link targets share one str object and
+    # membership tests hit CPython's identity fast path.
+    terms = [sys.intern(term) for term in terms]
+    links: Dict[str, Tuple[str, ...]] = {
+        sys.intern(src): tuple(sys.intern(tgt) for tgt in targets)
+        for src, targets in link_dict.items()
+    }
 
-    # Add nodes
-    for term in terms:
-        G.add_node(term)
+    G = nx.DiGraph() if directed else nx.Graph()
 
-    # Add edges
-    for src, targets in link_dict.items():
-        for tgt in targets:
-            if src in G and tgt in G:
-                G.add_edge(src, tgt)
+    # Add nodes (list keeps glossary order; set is for membership tests)
+    terms_set = frozenset(terms)
+    G.add_nodes_from(terms)
+
+    # Add edges between known terms only
+    G.add_edges_from(
+        (src, tgt)
+        for src, targets in links.items()
+        if src in terms_set
+        for tgt in targets
+        if tgt in terms_set
+    )
 
     return G
 
 
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+def _content_key(*paths: str, salt: str = "") -> str:
+    """
+    Hash the contents of the given files (plus `salt`) into a cache key.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    digest.update(salt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cache_load(path: Path) -> Optional[Any]:
+    """
+    Return a cached JSON value, or None if missing or unreadable.
+    """
+    try:
+        return load_json(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_store(obj: Any, path: Path) -> None:
+    """
+    Write a cache entry atomically so concurrent runs never see partial files.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    dump_json(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# Community detection
+# ---------------------------------------------------------------------------
+
+
+def _edge_index(G: nx.Graph) -> Tuple[List[str], List[int], List[int]]:
+    """
+    Integer-index a graph: returns (nodes, sources, targets) where edge k
+    runs from nodes[sources[k]] to nodes[targets[k]].
+    """
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    sources = [index[src] for src, _ in G.edges()]
+    targets = [index[tgt] for _, tgt in G.edges()]
+    return nodes, sources, targets
+
+
+def _to_igraph(G: nx.DiGraph) -> "igraph.Graph":
+    """
+    Convert a glossary graph to an undirected igraph.Graph.
+
+    Nodes are mapped to integer ids in G's node order; the original terms are
+    kept in the "name" vertex attribute. Reciprocal links collapse into one
+    edge, matching G.to_undirected(). The result is igraph's compact C edge
+    representation, which clustering, layout and the graph statistics all
+    read instead of NetworkX's dict-of-dicts adjacency.
+    """
+    nodes, sources, targets = _edge_index(G)
+    ig = igraph.Graph(n=len(nodes), edges=list(zip(sources, targets)), directed=False)
+    ig.simplify(multiple=True, loops=False)
+    ig.vs["name"] = nodes
+    return ig
+
+
+@contextlib.contextmanager
+def _seeded_igraph_rng(seed: int) -> Iterator[None]:
+    """
+    Run igraph with a generator seeded by `seed`, then hand igraph back the
+    stdlib random module, its generator at import time (igraph offers no way
+    to read the current generator, so that default is what gets restored).
+    """
+    igraph.set_random_number_generator(random.Random(seed))
+    try:
+        yield
+    finally:
+        igraph.set_random_number_generator(random)
+
+
+def detect_communities(
+    G: nx.DiGraph, seed: int = 42, ig: Optional["igraph.Graph"] = None
+) -> Dict[str, int]:
+    """
+    Partition the glossary graph with Louvain and return term -> cluster id.
+
+    Link direction is ignored for clustering. Isolated terms end up in
+    singleton clusters. Uses igraph's C implementation when available
+    (reusing `ig` if the caller already converted the graph), otherwise
+    NetworkX.
+    """
+    if igraph is not None:
+        if ig is None:
+            ig = _to_igraph(G)
+        with _seeded_igraph_rng(seed):
+            membership = ig.community_multilevel().membership
+        return dict(zip(ig.vs["name"], membership))
+
+    communities = nx.community.louvain_communities(G.to_undirected(), seed=seed)
+
+    assignments: Dict[str, int] = {}
+    for cluster_id, members in enumerate(communities):
+        for node in members:
+            assignments[node] = cluster_id
+    return assignments
+
+
+def update_communities(
+    G: nx.DiGraph, previous: Dict[str, Any], seed: int = 42
+) -> Optional[Dict[str, int]]:
+    """
+    Update a previous partition for a changed glossary graph.
+
+    `previous` holds an earlier run's "assignments" and "edges". Terms whose
+    links changed (or that are new) mark their connected components as
+    affected; only those components are re-clustered, and every other term
+    keeps its cluster. Louvain never merges disconnected terms, so untouched
+    components are partitioned as before. Cluster ids are renumbered 0..k-1.
+
+    Returns None when more than INCREMENTAL_MAX_CHANGE of the terms changed,
+    in which case the caller should re-cluster from scratch.
+    """
+    old_assignments = previous["assignments"]
+    old_edges = {tuple(edge) for edge in previous["edges"]}
+
+    changed = {
+        node for edge in old_edges.symmetric_difference(G.edges()) for node in edge
+    }
+    changed.update(node for node in G if node not in old_assignments)
+    changed.intersection_update(G)
+    if len(changed) > INCREMENTAL_MAX_CHANGE * G.number_of_nodes():
+        return None
+
+    undirected = G.to_undirected(as_view=True)
+    affected: set = set()
+    for node in changed:
+        if node not in affected:
+            affected |= nx.node_connected_component(undirected, node)
+
+    offset = max(old_assignments.values(), default=-1) + 1
+    fresh = detect_communities(G.subgraph(affected), seed=seed) if affected else {}
+
+    renumbered: Dict[int, int] = {}
+    return {
+        node: renumbered.setdefault(
+            fresh[node] + offset if node in affected else old_assignments[node],
+            len(renumbered),
+        )
+        for node in G
+    }
+
+
+def compute_modularity(
+    G: nx.Graph, assignments: Dict[str, int], ig: Optional["igraph.Graph"] = None
+) -> float:
+    """
+    Modularity of a term -> cluster partition on the undirected view of G.
+
+    Computed by igraph when its conversion of G is passed, otherwise NetworkX.
+    """
+    if G.number_of_edges() == 0:
+        return 0.0
+    if ig is not None:
+        return ig.modularity([assignments[name] for name in ig.vs["name"]])
+    communities: Dict[int, set] = {}
+    for node, cluster_id in assignments.items():
+        communities.setdefault(cluster_id, set()).add(node)
+    return nx.community.modularity(G.to_undirected(), communities.values())
+
+
 # ---------------------------------------------------------------------------
 # Graph statistics
 # ---------------------------------------------------------------------------
 
 
-def compute_graph_stats(G: nx.DiGraph) -> Dict[str, int]:
+def _count_components(G: nx.Graph) -> int:
+    """
+    Count connected components (ignoring link direction).
+
+    Runs scipy's C implementation on a sparse adjacency matrix when scipy is
+    available, otherwise falls back to NetworkX.
+    """
+    try:
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+    except ImportError:  # pragma: no cover - scipy ships with scikit-learn
+        if G.is_directed():
+            return nx.number_weakly_connected_components(G)
+        return nx.number_connected_components(G)
+
+    nodes, sources, targets = _edge_index(G)
+    if not nodes:
+        return 0
+    adjacency = coo_matrix(
+        (np.ones(len(sources), dtype=np.int8), (sources, targets)),
+        shape=(len(nodes), len(nodes)),
+    )
+    n_components, _ = connected_components(adjacency.tocsr(), directed=False)
+    return int(n_components)
+
+
+def compute_graph_stats(
+    G: nx.DiGraph, ig: Optional["igraph.Graph"] = None
+) -> Dict[str, int]:
     """
     Compute simple statistics for a glossary graph.
+
+    Isolates and components are counted on igraph's conversion of G when it
+    is passed.
     """
+    if ig is not None:
+        return {
+            "nodes": G.number_of_nodes(),
+            "edges": G.number_of_edges(),
+            "isolated_nodes": ig.degree().count(0),
+            "components": len(ig.connected_components()),
+        }
     return {
         "nodes": G.number_of_nodes(),
         "edges": G.number_of_edges(),
-        "isolated_nodes": len(list(nx.isolates(G))),
+        "isolated_nodes": sum(1 for _ in nx.isolates(G)),
+        "components": _count_components(G),
     }
 
 
@@ -84,15 +415,168 @@ def compute_graph_stats(G: nx.DiGraph) -> Dict[str, int]:
 # ---------------------------------------------------------------------------
 
 
-def visualize_graph(G: nx.DiGraph, output_path: str) -> None:
+# Matplotlib's tab20 colours, shared by the SVG and matplotlib outputs so a
+# partition is coloured the same way in both (cluster id modulo 20).
+_CLUSTER_PALETTE = (
+    "#1f77b4",
+    "#aec7e8",
+    "#ff7f0e",
+    "#ffbb78",
+    "#2ca02c",
+    "#98df8a",
+    "#d62728",
+    "#ff9896",
+    "#9467bd",
+    "#c5b0d5",
+    "#8c564b",
+    "#c49c94",
+    "#e377c2",
+    "#f7b6d2",
+    "#7f7f7f",
+    "#c7c7c7",
+    "#bcbd22",
+    "#dbdb8d",
+    "#17becf",
+    "#9edae5",
+)
+_DEFAULT_NODE_COLOR = "#1f78b4"
+
+
+def _node_fills(node_colors: Optional[List[int]], count: int) -> List[str]:
+    """Hex fill per node: its cluster's palette colour, or one default colour."""
+    if node_colors is None:
+        return [_DEFAULT_NODE_COLOR] * count
+    return [_CLUSTER_PALETTE[c % len(_CLUSTER_PALETTE)] for c in node_colors]
+
+
+def _write_svg(
+    G: nx.DiGraph,
+    pos: Dict[str, Tuple[float, float]],
+    output_path: str,
+    node_colors: Optional[List[int]] = None,
+    width: int = 800,
+    height: int = 600,
+    margin: int = 40,
+) -> None:
+    """
+    Write a node-link drawing of G as a standalone SVG file.
+    """
+    xs = [x for x, _ in pos.values()] or [0.0]
+    ys = [y for _, y in pos.values()] or [0.0]
+    min_x, min_y = min(xs), min(ys)
+    span_x = (max(xs) - min_x) or 1.0
+    span_y = (max(ys) - min_y) or 1.0
+
+    def scale(node: str) -> Tuple[float, float]:
+        x, y = pos[node]
+        return (
+            margin + (x - min_x) / span_x * (width - 2 * margin),
+            margin + (y - min_y) / span_y * (height - 2 * margin),
+        )
+
+    coords = {node: scale(node) for node in G.nodes()}
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}" viewBox="0 0 {width} {height}">\n',
+        '<g stroke="#999" stroke-width="1">\n',
+    ]
+    for src, tgt in G.edges():
+        (x1, y1), (x2, y2) = coords[src], coords[tgt]
+        parts.append(
+            f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}"/>\n'
+        )
+    parts.append("</g>\n")
+    parts.append('<g font-family="sans-serif" font-size="10" text-anchor="middle">\n')
+    fills = _node_fills(node_colors, len(coords))
+    for (node, (x, y)), fill in zip(coords.items(), fills):
+        parts.append(
+            f'<circle cx="{x:.1f}" cy="{y:.1f}" r="6" fill="{fill}"/>'
+            f'<text x="{x:.1f}" y="{y - 9:.1f}">{escape(str(node))}</text>\n'
+        )
+    parts.append("</g>\n</svg>\n")
+
+    Path(output_path).write_text("".join(parts), encoding="utf-8")
+
+
+def compute_layout(
+    G: nx.DiGraph, ig: Optional["igraph.Graph"] = None
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Compute a seeded 2D node layout for G.
+
+    Uses igraph's C Fruchterman-Reingold when igraph is available (reusing
+    `ig` if the caller already converted the graph), otherwise NetworkX's
+    pure-Python spring layout.
+    """
+    if ig is None and igraph is not None:
+        ig = _to_igraph(G)
+    if ig is not None:
+        with _seeded_igraph_rng(42):
+            coords = ig.layout_fruchterman_reingold().coords
+        return {node: (x, y) for node, (x, y) in zip(ig.vs["name"], coords)}
+    return {
+        node: (float(x), float(y))
+        for node, (x, y) in nx.spring_layout(G, seed=42).items()
+    }
+
+
+def visualize_graph(
+    G: nx.DiGraph,
+    output_path: str,
+    ig: Optional["igraph.Graph"] = None,
+    assignments: Optional[Dict[str, int]] = None,
+    pos: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> None:
     """
     Create a simple visualization of the glossary graph.
+
+    Uses `pos` if given, otherwise computes a layout (see compute_layout).
+    If cluster assignments are passed (covering every node), nodes are
+    coloured by cluster. An output path ending in ".svg" is written directly
+    without going through matplotlib.
     """
-    plt.figure(figsize=(8, 6))
-    pos = nx.spring_layout(G, seed=42)
-    nx.draw(G, pos, with_labels=True, node_size=800, font_size=10)
-    plt.savefig(output_path, dpi=150, bbox_inches="tight")
-    plt.close()
+    nodes = list(G.nodes())
+    node_colors = [assignments[n] for n in nodes] if assignments else None
+
+    if pos is None:
+        pos = compute_layout(G, ig=ig)
+
+    if str(output_path).endswith(".svg"):
+        _write_svg(G, pos, output_path, node_colors)
+        return
+
+    # Imported here so graph-only callers don't pay matplotlib's import cost;
+    # Agg avoids probing for GUI backends.
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    # All edges as one collection instead of one artist per edge
+    ax.add_collection(
+        LineCollection(
+            [(pos[src], pos[tgt]) for src, tgt in G.edges()],
+            colors="k",
+            linewidths=1.0,
+            antialiased=False,
+            zorder=1,
+        )
+    )
+    nx.draw_networkx_nodes(
+        G,
+        pos,
+        nodelist=nodes,
+        node_color=_node_fills(node_colors, len(nodes)),
+        node_size=800,
+        ax=ax,
+    )
+    nx.draw_networkx_labels(G, pos, font_size=10, ax=ax)
+    ax.set_axis_off()
+    fig.savefig(output_path, dpi=100, bbox_inches="tight")
+    plt.close(fig)
 
 
 # ---------------------------------------------------------------------------
@@ -106,32 +590,107 @@ def run_clustering(
     assignments_path: str,
     stats_path: str,
     viz_path: str,
+    use_cache: bool = True,
+    log_mlflow: bool = False,
 ) -> nx.DiGraph:
     """
     High-level function expected by tests/test_cluster_analysis.py.
 
     It must:
     - Build the graph
-    - Write cluster assignments CSV
+    - Detect communities and write cluster assignments CSV
     - Write graph stats JSON
-    - Write a visualization PNG
+    - Write a visualization PNG (skipped above VIS_NODE_LIMIT nodes or when
+      SKIP_PLOTS is set)
     - Return the graph
-    """
-    G = build_graph(glossary_json, link_dict_json)
 
-    # For the test suite, "cluster assignments" are simply the node list.
-    # (The test does not require real clustering.)
-    assignments_file = Path(assignments_path)
-    with assignments_file.open("w", encoding="utf-8") as f:
-        f.write("term,cluster\n")
-        for i, node in enumerate(G.nodes()):
-            f.write(f"{node},{i}\n")
+    Unless use_cache is False, the partition and layout are reused from
+    CACHE_DIR_NAME (next to stats_path) when both input files are unchanged,
+    and a small glossary change updates the previous partition instead of
+    re-clustering everything (see update_communities).
 
-    # Write graph stats
-    stats = compute_graph_stats(G)
-    Path(stats_path).write_text(json.dumps(stats, indent=2), encoding="utf-8")
+    Phase timings are logged to MLflow only with log_mlflow=True (the
+    pipeline entry point sets it), so library and test callers don't import
+    mlflow or write runs.
+    """
+    timings: Dict[str, float] = {}
+    backend = "igraph" if igraph is not None else "networkx"
+    cache_key = _content_key(glossary_json, link_dict_json, salt=backend)
+    cache_dir = Path(stats_path).parent / CACHE_DIR_NAME
+
+    with timed("graph_build", timings):
+        G = build_graph(glossary_json, link_dict_json)
+
+    # Ensure output directories exist (outputs usually share parents)
+    for directory in {Path(p).parent for p in (assignments_path, stats_path, viz_path)}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    with timed("clustering", timings):
+        # Convert once so clustering and layout share the same igraph
+        ig = _to_igraph(G) if igraph is not None else None
+        partition_cache = cache_dir / f"{cache_key}.json"
+        assignments = _cache_load(partition_cache) if use_cache else None
+        if assignments is None:
+            last_partition = cache_dir / LAST_PARTITION_NAME
+            previous = _cache_load(last_partition) if use_cache else None
+            if previous is not None:
+                assignments = update_communities(G, previous)
+            if assignments is None:
+                assignments = detect_communities(G, ig=ig)
+            if use_cache:
+                _cache_store(assignments, partition_cache)
+                _cache_store(
+                    {"assignments": assignments, "edges": list(G.edges())},
+                    last_partition,
+                )
+        # Cluster ids are 0..k-1, so sizes are a single bincount
+        cluster_sizes = np.bincount(
+            np.fromiter(assignments.values(), dtype=np.int32, count=len(assignments)),
+            minlength=1,
+        )
+        num_clusters = int(np.count_nonzero(cluster_sizes))
+
+    with timed("stats", timings):
+        stats = compute_graph_stats(G, ig=ig)
+        stats["clusters"] = num_clusters
+        stats["largest_cluster_size"] = int(cluster_sizes.max())
+        stats["modularity"] = compute_modularity(G, assignments, ig=ig)
+
+    # Write cluster assignments and graph stats
+    with timed("io", timings):
+        # csv quotes terms containing commas or quotes; ids stay plain ints
+        with open(assignments_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(("term", "cluster"))
+            writer.writerows((node, assignments[node]) for node in G.nodes())
+        dump_json(stats, stats_path)
+    print(f"✅ Cluster assignments saved: {assignments_path} ({num_clusters} clusters)")
 
     # Write visualization
-    visualize_graph(G, viz_path)
+    with timed("visualization", timings):
+        if not plots_enabled():
+            print("⚠️ Skipping visualization: SKIP_PLOTS is set")
+        elif G.number_of_nodes() <= VIS_NODE_LIMIT:
+            layout_cache = cache_dir / f"{cache_key}.layout.json"
+            pos = _cache_load(layout_cache) if use_cache else None
+            if pos is None:
+                pos = compute_layout(G, ig=ig)
+                if use_cache:
+                    _cache_store(pos, layout_cache)
+            visualize_graph(G, viz_path, ig=ig, assignments=assignments, pos=pos)
+        else:
+            print(
+                f"⚠️ Skipping visualization: {G.number_of_nodes()} nodes "
+                f"exceeds VIS_NODE_LIMIT ({VIS_NODE_LIMIT})"
+            )
+
+    # Log phase timings to MLflow
+    if log_mlflow:
+        try:
+            with get_run("cluster_analysis") as mlflow:
+                mlflow.log_metrics({f"{k}_seconds": v for k, v in timings.items()})
+                print("📊 Cluster analysis timings logged to MLflow")
+        except Exception as e:
+            print(f"⚠️ MLflow logging skipped: {e}")
 
     return G
@@ -1,40 +1,48 @@
 # src/cluster_terms.py
 """
 Cluster orchestration script.
-Runs graph clustering, semantic clustering, and evaluation in sequence.
+Runs graph clustering, semantic clustering, and evaluation in sequence,
+all in-process so heavy libraries are imported only once.
 Designed for consistent local and CI/CD execution.
 """
 
-import subprocess
 from pathlib import Path
 from src.cluster_analysis import run_clustering
+from src.evaluate_clusters import evaluate_clusters
+from src.mlflow_ctx import get_run
 from src.semantic_clustering import run_semantic_clustering
 
 # --- Repo root and directories ---
 REPO_ROOT = Path(__file__).resolve().parent.parent
-(REPO_ROOT / "output").mkdir(parents=True, exist_ok=True)
-(REPO_ROOT / "visualizations").mkdir(parents=True, exist_ok=True)
-(REPO_ROOT / "experiments" / "mlruns").mkdir(parents=True, exist_ok=True)
-
-
-def run_module(module: str) -> None:
-    """Helper to run another src module via subprocess."""
-    subprocess.run(["python3", "-m", module], check=True)
+OUTPUT_DIRS = (
+    REPO_ROOT / "output",
+    REPO_ROOT / "visualizations",
+    REPO_ROOT / "experiments" / "mlruns",
+)
 
 
 def main() -> None:
     """Run clustering pipeline: graph, semantic, then evaluation."""
-    print("▶ Running cluster_analysis...")
-    run_clustering(
-        str(REPO_ROOT / "data" / "aiml_glossary.json"),
-        str(REPO_ROOT / "data" / "link_dictionary.json"),
-    )
-
-    print("▶ Running semantic_clustering...")
-    run_semantic_clustering(str(REPO_ROOT / "data" / "aiml_glossary.json"))
-
-    print("▶ Running evaluate_clusters...")
-    run_module("src.evaluate_clusters")
+    for directory in OUTPUT_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # One parent MLflow run; each stage logs a nested run under it
+    with get_run("cluster_terms", optional=True):
+        print("▶ Running cluster_analysis...")
+        run_clustering(
+            str(REPO_ROOT / "data" / "aiml_glossary.json"),
+            str(REPO_ROOT / "data" / "link_dictionary.json"),
+            assignments_path=str(REPO_ROOT / "data" / "cluster_assignments.csv"),
+            stats_path=str(REPO_ROOT / "output" / "graph_stats.json"),
+            viz_path=str(REPO_ROOT / "visualizations" / "glossary_clusters.png"),
+            log_mlflow=True,
+        )
+
+        print("▶ Running semantic_clustering...")
+        run_semantic_clustering(str(REPO_ROOT / "data" / "aiml_glossary.json"))
+
+        print("▶ Running evaluate_clusters...")
+        evaluate_clusters()
 
     # Publishing handled by Makefile `publish` target
 
@@ -21,15 +21,23 @@ def run_pipeline(
     if not glossary_dict:
         raise ValueError("Glossary is empty or invalid.")
 
+    glossary_path = str(resolve_uri(glossary_file))
     link_dict_path = resolve_uri(link_dict_file)
     if not link_dict_path.exists():
         raise FileNotFoundError(f"Link dictionary file not found: {link_dict_path}")
 
     print("▶ Running graph-based clustering...")
-    run_clustering(glossary_file, link_dict_file)
+    run_clustering(
+        glossary_path,
+        str(link_dict_path),
+        assignments_path=str(resolve_uri("data:cluster_assignments.csv")),
+        stats_path=str(resolve_uri("output:graph_stats.json")),
+        viz_path=str(resolve_uri("visualizations:glossary_clusters.png")),
+        log_mlflow=True,
+    )
 
     print("▶ Running semantic clustering...")
-    run_semantic_clustering(glossary_file, num_clusters=num_clusters)
+    run_semantic_clustering(glossary_path, n_clusters=num_clusters)
 
     print("▶ Evaluating clusters...")
     metrics = evaluate_clusters()
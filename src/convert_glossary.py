@@ -1,7 +1,7 @@
 # src/convert_glossary.py
 
 from pathlib import Path
-import json
+from src.utils import dump_json
 
 
 def convert_glossary(
@@ -37,21 +37,20 @@ def convert_glossary(
     if not markdown_file.exists():
         raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
 
-    text = markdown_file.read_text(encoding="utf-8")
-
-    # Very simple parser: assume "Term: Definition" per line
+    # Very simple parser: assume "Term: Definition" per line, streamed so
+    # the Markdown text is never held in memory whole
     entries = []
-    for line in text.splitlines():
-        if ":" in line:
-            term, definition = line.split(":", 1)
-            entries.append({"term": term.strip(), "definition": definition.strip()})
+    with markdown_file.open("r", encoding="utf-8", buffering=1 << 20) as f:
+        for line in f:
+            if ":" in line:
+                term, definition = line.split(":", 1)
+                entries.append({"term": term.strip(), "definition": definition.strip()})
 
     # Ensure directory exists
     json_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Write JSON
-    with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(entries, f, indent=2, ensure_ascii=False)
+    dump_json(entries, json_file)
 
     print(f"Converted {len(entries)} entries from Markdown → JSON at {json_file}")
     return entries
@@ -5,8 +5,7 @@ Checks whether each expected output/visualization file exists and saves a summar
 Also validates glossary presence and normalization via load_glossary().
 """
 
-import json
-from src.utils import resolve_uri, load_glossary
+from src.utils import dump_json, existing_paths, resolve_uri, load_glossary
 
 
 EXPECTED_ARTIFACTS = [
@@ -36,17 +35,19 @@ def generate_report() -> dict:
     except Exception as e:
         report["data:aiml_glossary.json"] = f"Error: {e}"
 
-    # Check other artifacts
-    for uri in EXPECTED_ARTIFACTS:
-        if uri == "data:aiml_glossary.json":
-            continue  # already checked above
-        path = resolve_uri(uri)
-        report[uri] = path.exists()
+    # Check other artifacts (one directory listing per parent)
+    paths = {
+        uri: resolve_uri(uri)
+        for uri in EXPECTED_ARTIFACTS
+        if uri != "data:aiml_glossary.json"  # already checked above
+    }
+    present = existing_paths(paths.values())
+    for uri, path in paths.items():
+        report[uri] = path in present
 
     # Save report
     report_file = resolve_uri("data/coverage_report.json")
-    with open(report_file, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+    dump_json(report, report_file)
 
     # Console summary
     print("Coverage Report:")
@@ -1,9 +1,8 @@
 # src/enrich_glossary.py
 
-import json
-from pathlib import Path
 import sys
-import mlflow
+from src.mlflow_ctx import get_run
+from src.utils import REPO_ROOT, dump_json, load_json, load_json_cached
 
 
 def enrich_glossary(
@@ -20,41 +19,37 @@ def enrich_glossary(
     - Logs artifact into MLflow for contributor inspection.
     """
 
-    # Resolve repo root (two levels up from this file: src/ -> repo root)
-    repo_root = Path(__file__).resolve().parent.parent
-    glossary_path = (repo_root / glossary_json).resolve()
-    link_dict_path = (repo_root / link_dict_json).resolve()
-    output_path = (repo_root / output_file).resolve()
+    glossary_path = (REPO_ROOT / glossary_json).resolve()
+    link_dict_path = (REPO_ROOT / link_dict_json).resolve()
+    output_path = (REPO_ROOT / output_file).resolve()
 
     if not glossary_path.exists():
         raise FileNotFoundError(f"Glossary file not found: {glossary_path}")
     if not link_dict_path.exists():
         raise FileNotFoundError(f"Link dictionary file not found: {link_dict_path}")
 
-    # Load glossary
-    with open(glossary_path, "r", encoding="utf-8") as f:
-        glossary_dict = json.load(f)
+    # Load glossary and link dictionary
+    # The glossary parse may be shared with other stages, so entries are
+    # copied rather than mutated
+    glossary_dict = load_json_cached(glossary_path)
+    link_dict = load_json(link_dict_path)
 
-    # Load link dictionary
-    with open(link_dict_path, "r", encoding="utf-8") as f:
-        link_dict = json.load(f)
-
-    # Enrich glossary entries
-    for slug, entry in glossary_dict.items():
-        term = entry.get("term", slug)
-        linked_terms = link_dict.get(term, [])
-        entry["linked_terms"] = linked_terms
+    # Enrich glossary entries in one pass (one hash lookup per entry)
+    links_for = link_dict.get
+    glossary_dict = {
+        slug: {**entry, "linked_terms": links_for(entry.get("term", slug)) or []}
+        for slug, entry in glossary_dict.items()
+    }
 
     # Save enriched glossary
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(glossary_dict, f, indent=2, ensure_ascii=False)
+    dump_json(glossary_dict, output_path)
 
     print(f"✅ Enriched glossary saved: {output_path}")
 
     # Log artifact into MLflow
     try:
-        with mlflow.start_run(run_name="enrich_glossary", nested=True):
+        with get_run("enrich_glossary") as mlflow:
             mlflow.log_artifact(str(output_path), artifact_path="enriched_glossary")
             mlflow.log_param("entries", len(glossary_dict))
             print("📊 Enriched glossary logged to MLflow")
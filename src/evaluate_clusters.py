@@ -1,29 +1,48 @@
 # src/evaluate_clusters.py
 
-import json
-import csv
 from pathlib import Path
 import sys
-import mlflow
+import pandas as pd
 from sklearn.metrics import adjusted_rand_score
+from src.mlflow_ctx import get_run, log_files
+from src.utils import REPO_ROOT, dump_json
 
 
 def resolve_uri(uri: str) -> Path:
     """
     Resolve a URI like 'data:filename.csv' into a repo-root Path.
     """
-    repo_root = Path(__file__).resolve().parent.parent
     if ":" not in uri:
-        return (repo_root / uri).resolve()
+        return (REPO_ROOT / uri).resolve()
     prefix, relpath = uri.split(":", 1)
     if prefix == "data":
-        return (repo_root / "data" / relpath).resolve()
+        return (REPO_ROOT / "data" / relpath).resolve()
     elif prefix == "output":
-        return (repo_root / "output" / relpath).resolve()
+        return (REPO_ROOT / "output" / relpath).resolve()
     else:
         raise ValueError(f"Unknown URI prefix: {prefix}")
 
 
+# Schema of the cluster assignment CSVs written by the clustering stages.
+# Cluster labels stay strings, so non-integer labels compare as written.
+ASSIGNMENT_DTYPES = {"term": "string", "cluster": "string"}
+
+
+def load_assignments(path: Path) -> pd.DataFrame:
+    """
+    Read a term,cluster CSV with explicit dtypes (no type inference pass).
+    Empty cells stay empty strings. Duplicate terms keep their last assignment.
+    """
+    df = pd.read_csv(
+        path,
+        usecols=list(ASSIGNMENT_DTYPES),
+        dtype=ASSIGNMENT_DTYPES,
+        keep_default_na=False,
+        engine="c",
+    )
+    return df.drop_duplicates("term", keep="last")
+
+
 def evaluate_clusters(
     graph_assignments_uri: str = "data:cluster_assignments.csv",
     semantic_assignments_uri: str = "data:semantic_cluster_assignments.csv",
@@ -35,7 +54,6 @@ def evaluate_clusters(
     - data/ari_metrics.json with adjusted Rand index (ARI)
     """
 
-    repo_root = Path(__file__).resolve().parent.parent
     graph_assignments_file = resolve_uri(graph_assignments_uri)
     semantic_assignments_file = resolve_uri(semantic_assignments_uri)
 
@@ -48,26 +66,18 @@ def evaluate_clusters(
             f"Semantic assignments file not found: {semantic_assignments_file}"
         )
 
-    # Load graph assignments
-    graph_assignments = {}
-    with open(graph_assignments_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            graph_assignments[row["term"]] = row["cluster"]
-
-    # Load semantic assignments
-    semantic_assignments = {}
-    with open(semantic_assignments_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            semantic_assignments[row["term"]] = row["cluster"]
+    # Align both assignments on their common terms
+    merged = load_assignments(graph_assignments_file).merge(
+        load_assignments(semantic_assignments_file),
+        on="term",
+        suffixes=("_graph", "_semantic"),
+    )
+    labels_graph = merged["cluster_graph"].to_numpy()
+    labels_semantic = merged["cluster_semantic"].to_numpy()
 
     # Compute overlap stats
-    common_terms = set(graph_assignments.keys()) & set(semantic_assignments.keys())
-    agreements = sum(
-        1 for t in common_terms if graph_assignments[t] == semantic_assignments[t]
-    )
-    total = len(common_terms)
+    agreements = int((labels_graph == labels_semantic).sum())
+    total = len(merged)
     agreement_ratio = agreements / total if total > 0 else 0.0
 
     graph_stats = {
@@ -77,32 +87,27 @@ def evaluate_clusters(
     }
 
     # Compute ARI
-    labels_graph = [graph_assignments[t] for t in common_terms]
-    labels_semantic = [semantic_assignments[t] for t in common_terms]
     ari_score = adjusted_rand_score(labels_graph, labels_semantic) if total > 0 else 0.0
     ari_metrics = {"adjusted_rand_index": ari_score}
 
     # Save both artifacts
-    graph_stats_path = repo_root / "data/graph_stats.json"
-    ari_metrics_path = repo_root / "data/ari_metrics.json"
+    graph_stats_path = REPO_ROOT / "data/graph_stats.json"
+    ari_metrics_path = REPO_ROOT / "data/ari_metrics.json"
+    graph_stats_path.parent.mkdir(parents=True, exist_ok=True)
     for path, obj in [(graph_stats_path, graph_stats), (ari_metrics_path, ari_metrics)]:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(obj, f, indent=2)
+        dump_json(obj, path)  # one write_bytes per file
         print(f"✅ Saved {path}")
 
     # Log to MLflow
     try:
-        with mlflow.start_run(run_name="evaluate_clusters", nested=True):
-            mlflow.log_artifact(
-                str(graph_stats_path), artifact_path="cluster_evaluation"
+        with get_run("evaluate_clusters") as mlflow:
+            log_files(
+                mlflow, [graph_stats_path, ari_metrics_path], "cluster_evaluation"
             )
-            mlflow.log_artifact(
-                str(ari_metrics_path), artifact_path="cluster_evaluation"
+            mlflow.log_metrics(
+                {"agreement_ratio": agreement_ratio, "adjusted_rand_index": ari_score}
             )
-            mlflow.log_metric("agreement_ratio", agreement_ratio)
-            mlflow.log_metric("adjusted_rand_index", ari_score)
-            mlflow.log_param("total_terms", total)
+            mlflow.log_params({"total_terms": total})
             print("📊 Cluster evaluation logged to MLflow")
     except Exception as e:
         print(f"⚠️ MLflow logging skipped: {e}")
@@ -1,8 +1,81 @@
 # src/generate_outputs.py
 
-import json
+import csv
+import io
 from pathlib import Path
 import sys
+from typing import Any, Iterator, Optional, Tuple
+from src.utils import REPO_ROOT, dump_json, dumps_json, existing_paths, load_json
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is an optional speedup
+    ijson = None
+
+
+CSV_COLUMNS = (
+    "slug",
+    "term",
+    "definition",
+    "tags",
+    "related_terms",
+    "examples",
+    "source",
+    "last_updated",
+)
+
+# Rows buffered in memory between writes to terms.csv
+CSV_FLUSH_ROWS = 1024
+
+_UNSUPPORTED_FORMAT = "Unsupported glossary format: expected a dict of entries"
+
+
+def _csv_field(value: str) -> str:
+    """Quote a field the way csv.QUOTE_MINIMAL does for commas and quotes."""
+    if "," in value or '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _csv_row(fields: Tuple[Any, ...]) -> Optional[bytes]:
+    """
+    Encode a CSV row straight to UTF-8 bytes, or None if csv.writer is needed.
+
+    Only plain str fields without line breaks take this path; anything else
+    (None, numbers, embedded newlines) is left to csv.writer so the output
+    stays identical to what it would write.
+    """
+    for value in fields:
+        if not isinstance(value, str) or "\n" in value or "\r" in value:
+            return None
+    return (",".join([_csv_field(value) for value in fields]) + "\n").encode("utf-8")
+
+
+def _iter_entries(glossary_path: Path) -> Iterator[Tuple[str, Any]]:
+    """
+    Return an iterator of (slug, entry) pairs from a dict-of-entries
+    glossary file, raising ValueError up front for any other layout.
+
+    With ijson available the file is streamed one entry at a time; otherwise
+    the whole document is parsed first.
+    """
+    if ijson is None:
+        glossary = load_json(glossary_path)
+        if not isinstance(glossary, dict):
+            raise ValueError(_UNSUPPORTED_FORMAT)
+        return iter(glossary.items())
+
+    # Only the first event is parsed to check the top-level container
+    with glossary_path.open("rb") as f:
+        _, first_event, _ = next(ijson.parse(f))
+    if first_event != "start_map":
+        raise ValueError(_UNSUPPORTED_FORMAT)
+    return _stream_entries(glossary_path)
+
+
+def _stream_entries(glossary_path: Path) -> Iterator[Tuple[str, Any]]:
+    with glossary_path.open("rb") as f:
+        yield from ijson.kvitems(f, "", use_float=True)
 
 
 def generate(glossary_json: str = "data/aiml_glossary.json", output_dir: str = "data"):
@@ -15,40 +88,57 @@ def generate(glossary_json: str = "data/aiml_glossary.json", output_dir: str = "
     - Defaults to writing into data/ as canonical sources.
     """
 
-    repo_root = Path(__file__).resolve().parent.parent
-    glossary_path = (repo_root / glossary_json).resolve()
-    output_path = (repo_root / output_dir).resolve()
+    glossary_path = (REPO_ROOT / glossary_json).resolve()
+    output_path = (REPO_ROOT / output_dir).resolve()
     output_path.mkdir(parents=True, exist_ok=True)
 
     if not glossary_path.exists():
         raise FileNotFoundError(f"Glossary file not found: {glossary_path}")
 
-    with open(glossary_path, "r", encoding="utf-8") as f:
-        glossary_dict = json.load(f)
+    entries = _iter_entries(glossary_path)
 
     # Canonical filenames
     csv_file = output_path / "terms.csv"
     json_file = output_path / "glossary_copy.json"
 
-    with open(csv_file, "w", encoding="utf-8") as f:
-        f.write(
-            "slug,term,definition,tags,related_terms,examples,source,last_updated\n"
-        )
-        for slug, entry in glossary_dict.items():
-            term = entry.get("term", slug)
-            definition = entry.get("definition", "")
-            tags = ";".join(entry.get("tags", []))
-            related_terms = ";".join(entry.get("related_terms", []))
-            examples = ";".join(entry.get("examples", []))
-            source = entry.get("source", "")
-            last_updated = entry.get("last_updated", "")
-            safe_def = definition.replace(",", ";")
-            f.write(
-                f"{slug},{term},{safe_def},{tags},{related_terms},{examples},{source},{last_updated}\n"
+    # Stream entries into both outputs so only one entry is held at a time.
+    # The JSON copy is laid out exactly as dump_json would write the dict.
+    # CSV rows are encoded to bytes and flushed in batches rather than going
+    # through a text-mode writer one row at a time.
+    text = io.StringIO()
+    writer = csv.writer(text, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+    with open(csv_file, "wb") as f, open(json_file, "wb") as out:
+        buf = bytearray(_csv_row(CSV_COLUMNS))
+        out.write(b"{")
+        separator = b"\n  "
+        for n, (slug, entry) in enumerate(entries, 1):
+            out.write(separator + dumps_json(slug) + b": ")
+            out.write(dumps_json(entry).replace(b"\n", b"\n  "))
+            separator = b",\n  "
+
+            # csv quotes fields containing commas, so definitions stay intact
+            row = (
+                slug,
+                entry.get("term", slug),
+                entry.get("definition", ""),
+                ";".join(entry.get("tags", [])),
+                ";".join(entry.get("related_terms", [])),
+                ";".join(entry.get("examples", [])),
+                entry.get("source", ""),
+                entry.get("last_updated", ""),
             )
-
-    with open(json_file, "w", encoding="utf-8") as f:
-        json.dump(glossary_dict, f, indent=2, ensure_ascii=False)
+            encoded = _csv_row(row)
+            if encoded is None:
+                writer.writerow(row)
+                encoded = text.getvalue().encode("utf-8")
+                text.seek(0)
+                text.truncate()
+            buf += encoded
+            if n % CSV_FLUSH_ROWS == 0:
+                f.write(buf)
+                buf.clear()
+        f.write(buf)
+        out.write(b"}" if separator == b"\n  " else b"\n}")
 
     print(f"✅ Outputs generated: {csv_file}, {json_file}")
 
@@ -62,52 +152,50 @@ def generate_report(output_file: str = "data/coverage_report.json"):
     - Prints grouped coverage metrics.
     """
 
-    repo_root = Path(__file__).resolve().parent.parent
-
     # Expected artifacts
     data_files = [
-        repo_root / "data/aiml_glossary.json",
-        repo_root / "data/terms.csv",
-        repo_root / "data/glossary_copy.json",
-        repo_root / "data/link_dictionary.json",
-        repo_root / "data/enriched_glossary.json",
-        repo_root / "data/cluster_assignments.csv",
-        repo_root / "data/semantic_cluster_assignments.csv",
-        repo_root / "data/graph_stats.json",
-        repo_root / "data/ari_metrics.json",
-        repo_root / "data/coverage_report.json",
+        REPO_ROOT / "data/aiml_glossary.json",
+        REPO_ROOT / "data/terms.csv",
+        REPO_ROOT / "data/glossary_copy.json",
+        REPO_ROOT / "data/link_dictionary.json",
+        REPO_ROOT / "data/enriched_glossary.json",
+        REPO_ROOT / "data/cluster_assignments.csv",
+        REPO_ROOT / "data/semantic_cluster_assignments.csv",
+        REPO_ROOT / "data/graph_stats.json",
+        REPO_ROOT / "data/ari_metrics.json",
+        REPO_ROOT / "data/coverage_report.json",
     ]
     viz_files = [
-        repo_root / "visualizations/glossary_clusters.png",
-        repo_root / "visualizations/semantic_clusters.png",
+        REPO_ROOT / "visualizations/glossary_clusters.png",
+        REPO_ROOT / "visualizations/semantic_clusters.png",
     ]
 
     # Build coverage dict
-    coverage = {str(path): path.exists() for path in data_files + viz_files}
+    present = existing_paths(data_files + viz_files)
+    coverage = {str(path): path in present for path in data_files + viz_files}
 
     # Always write JSON to canonical location
-    output_path = (repo_root / "data/coverage_report.json").resolve()
+    output_path = (REPO_ROOT / "data/coverage_report.json").resolve()
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(coverage, f, indent=2)
+    dump_json(coverage, output_path)
 
     # Print grouped report
     print("Coverage Report:")
 
     def print_group(name, files):
-        present = sum(1 for p in files if coverage[str(p)])
+        found = sum(1 for p in files if p in present)
         total = len(files)
-        print(f"\n{name} ({present}/{total} present = {present/total:.0%})")
+        print(f"\n{name} ({found}/{total} present = {found/total:.0%})")
         for p in files:
-            status = "✅" if coverage[str(p)] else "❌"
-            print(f"{status} {p.name} ({coverage[str(p)]})")
+            exists = p in present
+            print(f"{'✅' if exists else '❌'} {p.name} ({exists})")
 
     print_group("Data artifacts", data_files)
     print_group("Visualizations", viz_files)
 
     # Overall coverage
-    overall_present = sum(1 for v in coverage.values() if v)
+    overall_present = len(present)
     overall_total = len(coverage)
     print(
         f"\nOverall coverage: {overall_present}/{overall_total} files = {overall_present/overall_total:.0%}"
@@ -115,32 +203,26 @@ def generate_report(output_file: str = "data/coverage_report.json"):
     print(f"Coverage report written to {output_path}")
 
     # --- Write Markdown summary ---
-    md_path = repo_root / "data/coverage_report.md"
-    lines = []
-    lines.append("# ✅ Coverage Summary\n")
-    lines.append(
+    md_path = REPO_ROOT / "data/coverage_report.md"
+
+    def table(files):
+        return "| File | Status |\n|------|--------|\n" + "".join(
+            f"| `{p.relative_to(REPO_ROOT)}` | "
+            f"{'✅ Present' if p in present else '❌ Missing'} |\n"
+            for p in files
+        )
+
+    md = (
+        "# ✅ Coverage Summary\n"
         "This report shows the presence and status of all canonical artifacts.\n\n"
+        "## 📁 Data Artifacts\n"
+        f"{table(data_files)}"
+        "\n## 🖼️ Visualizations\n"
+        f"{table(viz_files)}"
+        "\n## 📊 Overall Coverage\n"
+        f"**✅ {overall_present} / {overall_total} artifacts present**\n"
     )
-
-    # Data artifacts table
-    lines.append("## 📁 Data Artifacts\n")
-    lines.append("| File | Status |\n|------|--------|\n")
-    for p in data_files:
-        status = "✅ Present" if coverage[str(p)] else "❌ Missing"
-        lines.append(f"| `{p.relative_to(repo_root)}` | {status} |\n")
-
-    # Visualizations table
-    lines.append("\n## 🖼️ Visualizations\n")
-    lines.append("| File | Status |\n|------|--------|\n")
-    for p in viz_files:
-        status = "✅ Present" if coverage[str(p)] else "❌ Missing"
-        lines.append(f"| `{p.relative_to(repo_root)}` | {status} |\n")
-
-    # Overall summary
-    lines.append("\n## 📊 Overall Coverage\n")
-    lines.append(f"**✅ {overall_present} / {overall_total} artifacts present**\n")
-
-    md_path.write_text("".join(lines), encoding="utf-8")
+    md_path.write_bytes(md.encode("utf-8"))
     print(f"Markdown coverage summary written to {md_path}")
 
     return coverage
@@ -1,59 +1,229 @@
 # src/link_dictionary.py
 
-import json
-from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import os
+import re
 import sys
-import mlflow
+from typing import Callable, Iterator, List, Optional, Set
+import numpy as np
+from src.mlflow_ctx import get_run
+from src.utils import REPO_ROOT, dump_json, load_json_cached
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - pyahocorasick is an optional speedup
+    ahocorasick = None
+
+
+# Runs of letters/digits; terms and definitions are compared word by word
+_WORD_RE = re.compile(r"[^\W_]+")
+# Terms made only of words joined by spaces, hyphens or underscores, which
+# the word comparison represents without losing characters
+_PLAIN_TERM_RE = re.compile(r"[^\W_]+(?:[\s_-]+[^\W_]+)*")
+
+
+def _word_matcher(lowered: List[str]) -> Callable[[str], Set[int]]:
+    """
+    Match whole words only: each text is tokenized once into the set of its
+    word n-grams (up to the longest term's word count), which is intersected
+    with the terms' normalized word sequences.
+
+    Terms with other punctuation ("c++", "c#", ".net") would lose characters
+    in that normalization, so they are instead searched for as substrings
+    not preceded or followed by a letter or digit.
+    """
+    indices_by_key = defaultdict(list)
+    patterns = []
+    for i, term in enumerate(lowered):
+        term = term.strip()
+        if _PLAIN_TERM_RE.fullmatch(term):
+            indices_by_key[" ".join(_WORD_RE.findall(term))].append(i)
+        elif _WORD_RE.search(term):  # terms without words never match
+            patterns.append((i, re.compile(rf"(?<![^\W_]){re.escape(term)}(?![^\W_])")))
+    keys = set(indices_by_key)
+    max_words = max((key.count(" ") + 1 for key in keys), default=0)
+
+    def matches(text: str) -> Set[int]:
+        words = _WORD_RE.findall(text)
+        grams = {
+            " ".join(words[j : j + n])
+            for n in range(1, max_words + 1)
+            for j in range(len(words) - n + 1)
+        }
+        found = set()
+        for key in grams & keys:
+            found.update(indices_by_key[key])
+        found.update(i for i, pattern in patterns if pattern.search(text))
+        return found
+
+    return matches
+
+
+def _char_mask(text: str) -> int:
+    """64-bit mask with one bit per distinct character (code point mod 64)."""
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def _scan_matcher(lowered: List[str]) -> Callable[[str], Set[int]]:
+    """
+    Fallback without pyahocorasick: test each term with a substring search,
+    but only the terms whose characters all occur in the text, found with
+    one vectorized AND over the terms' character masks.
+    """
+    term_masks = np.array([_char_mask(term) for term in lowered], dtype=np.uint64)
+
+    def matches(text: str) -> Set[int]:
+        text_mask = np.uint64(_char_mask(text))
+        candidates = np.flatnonzero((term_masks & text_mask) == term_masks)
+        return {i for i in candidates.tolist() if lowered[i] in text}
+
+    return matches
+
+
+def _term_matcher(
+    terms: List[str], word_boundaries: bool = False
+) -> Callable[[str], Set[int]]:
+    """
+    Build a function returning the indices of all terms that occur
+    (case-insensitively, as substrings) in a lowercased text.
+
+    Uses a single Aho-Corasick automaton over all terms when pyahocorasick is
+    installed, so each text is scanned once regardless of glossary size;
+    otherwise tests each term whose characters all occur in the text. With
+    word_boundaries, terms must match whole words ("ai" no longer matches
+    inside "train"); see _word_matcher.
+    """
+    lowered = [term.lower() for term in terms]
+
+    if word_boundaries:
+        return _word_matcher(lowered)
+
+    if ahocorasick is None:
+        return _scan_matcher(lowered)
+
+    # Terms differing only in case share one automaton key
+    indices_by_key = defaultdict(list)
+    for i, term in enumerate(lowered):
+        indices_by_key[term].append(i)
+    always = set(indices_by_key.pop("", ()))  # "" occurs in every text
+
+    automaton = ahocorasick.Automaton()
+    for key, indices in indices_by_key.items():
+        automaton.add_word(key, tuple(indices))
+    if not indices_by_key:
+        return lambda text: set(always)
+    automaton.make_automaton()
+
+    def matches(text: str) -> Set[int]:
+        found = set(always)
+        for _, indices in automaton.iter(text):
+            found.update(indices)
+        return found
+
+    return matches
+
+
+# Below this many definitions, worker start-up costs more than the scan
+PARALLEL_MIN_ENTRIES = 5000
+_CHUNK_SIZE = 256
+
+# Per-worker matcher, built once by _init_worker
+_worker_matches: Optional[Callable[[str], Set[int]]] = None
+
+
+def _init_worker(terms: List[str], word_boundaries: bool) -> None:
+    global _worker_matches
+    _worker_matches = _term_matcher(terms, word_boundaries)
+
+
+def _scan_chunk(texts: List[str]) -> List[List[int]]:
+    return [sorted(_worker_matches(text)) for text in texts]
+
+
+def _scan_definitions(
+    terms: List[str], texts: List[str], word_boundaries: bool = False
+) -> Iterator[List[int]]:
+    """
+    Yield the sorted indices of the terms found in each lowercased text.
+
+    Large glossaries are scanned in chunks across worker processes (the scan
+    is pure CPU, so threads would serialize on the GIL); each worker builds
+    its own matcher once.
+    """
+    workers = os.cpu_count() or 1
+    if len(texts) < PARALLEL_MIN_ENTRIES or workers < 2:
+        matches = _term_matcher(terms, word_boundaries)
+        for text in texts:
+            yield sorted(matches(text))
+        return
+
+    chunks = [texts[i : i + _CHUNK_SIZE] for i in range(0, len(texts), _CHUNK_SIZE)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(terms, word_boundaries)
+    ) as executor:
+        for found in executor.map(_scan_chunk, chunks):
+            yield from found
 
 
 def build_link_dictionary(
-    glossary_json: str, output_file: str = "link_dictionary.json"
+    glossary_json: str,
+    output_file: str = "link_dictionary.json",
+    word_boundaries: bool = False,
 ):
     """
     Build a link dictionary mapping each term to related terms found in its definition text.
     - Resolves paths relative to repo root.
     - Iterates over dict-of-entries JSON.
+    - Matches terms as substrings, or as whole words with word_boundaries.
     - Saves link dictionary to JSON.
     - Logs artifact into MLflow for contributor inspection.
     """
 
-    # Resolve repo root (two levels up from this file: src/ -> repo root)
-    repo_root = Path(__file__).resolve().parent.parent
-    glossary_path = (repo_root / glossary_json).resolve()
+    glossary_path = (REPO_ROOT / glossary_json).resolve()
 
     if not glossary_path.exists():
         raise FileNotFoundError(f"Glossary file not found: {glossary_path}")
 
-    with open(glossary_path, "r", encoding="utf-8") as f:
-        glossary_dict = json.load(f)
+    glossary_dict = load_json_cached(glossary_path)
 
-    # Collect all canonical terms
-    terms = [entry.get("term", slug) for slug, entry in glossary_dict.items()]
-
-    link_dict = {t: [] for t in terms}
-
-    # Build dictionary by scanning definitions
+    # Collect canonical terms (interned: each is shared by many link lists)
+    # and lowercased definitions in a single pass over the glossary
+    terms: List[str] = []
+    definitions: List[str] = []
     for slug, entry in glossary_dict.items():
-        term = entry.get("term", slug)
-        definition_text = entry.get("definition", "")
+        terms.append(sys.intern(entry.get("term", slug)))
+        definitions.append(entry.get("definition", "").lower())
 
-        for other in terms:
-            if other != term and other.lower() in definition_text.lower():
-                link_dict[term].append(other)
+    link_dict = {t: [] for t in terms}
 
-    # Save link dictionary to JSON
-    output_path = (repo_root / output_file).resolve()
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(link_dict, f, indent=2, ensure_ascii=False)
+    # Build dictionary by scanning definitions (one pass per definition)
+    for term, found in zip(
+        terms, _scan_definitions(terms, definitions, word_boundaries)
+    ):
+        link_dict[term].extend(terms[i] for i in found if terms[i] != term)
 
-    print(f"✅ Link dictionary built: {output_path}")
+    # Save link dictionary to JSON, skipping the rewrite on no-op runs
+    output_path = (REPO_ROOT / output_file).resolve()
+    if dump_json(link_dict, output_path, only_if_changed=True):
+        print(f"✅ Link dictionary built: {output_path}")
+    else:
+        print(f"✅ Link dictionary unchanged: {output_path}")
 
     # Log artifact into MLflow
     try:
-        with mlflow.start_run(run_name="link_dictionary", nested=True):
+        with get_run("link_dictionary") as mlflow:
             mlflow.log_artifact(str(output_path), artifact_path="link_dictionary")
-            mlflow.log_param("entries", len(glossary_dict))
-            mlflow.log_param("linked_terms", sum(len(v) for v in link_dict.values()))
+            mlflow.log_params(
+                {
+                    "entries": len(glossary_dict),
+                    "word_boundaries": word_boundaries,
+                    "linked_terms": sum(len(v) for v in link_dict.values()),
+                }
+            )
             print("📊 Link dictionary logged to MLflow")
     except Exception as e:
         print(f"⚠️ MLflow logging skipped: {e}")
@@ -62,11 +232,17 @@ def build_link_dictionary(
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python -m src.link_dictionary <glossary_json> [output_file]")
+    args = [arg for arg in sys.argv[1:] if arg != "--word-boundaries"]
+    if not args:
+        print(
+            "Usage: python -m src.link_dictionary <glossary_json> [output_file]"
+            " [--word-boundaries]"
+        )
         sys.exit(1)
 
-    glossary_json = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else "link_dictionary.json"
+    glossary_json = args[0]
+    output_file = args[1] if len(args) > 1 else "link_dictionary.json"
 
-    build_link_dictionary(glossary_json, output_file)
+    build_link_dictionary(
+        glossary_json, output_file, word_boundaries="--word-boundaries" in sys.argv
+    )
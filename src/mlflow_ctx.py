@@ -0,0 +1,94 @@
+# src/mlflow_ctx.py
+"""
+Shared MLflow run context for pipeline stages.
+Configures the tracking URI once per process and nests each stage's run under
+the active run (if any), so a full pipeline logs into one MLflow session.
+"""
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src.utils import REPO_ROOT
+
+# Matches the MLRUNS directory created and cleaned by the Makefile.
+TRACKING_DIR = REPO_ROOT / "experiments" / "mlruns"
+# Same experiment the analysis notebook's dashboard reads from.
+EXPERIMENT_NAME = "AIML Glossary Analysis"
+
+# Tracking URI _configure last set up, so a changed MLFLOW_TRACKING_URI
+# (e.g. a test pointing MLflow at its tmp_path) is picked up
+_configured_uri: Optional[str] = None
+
+
+def _configure(mlflow) -> None:
+    """
+    Point MLflow at TRACKING_DIR and EXPERIMENT_NAME, unless overridden via
+    MLFLOW_TRACKING_URI / MLFLOW_EXPERIMENT_NAME.
+
+    Runs once per tracking URI: an MLFLOW_TRACKING_URI that is already set
+    always wins over TRACKING_DIR, and changing it reconfigures MLflow.
+    """
+    global _configured_uri
+    tracking_uri = os.environ.get("MLFLOW_TRACKING_URI") or TRACKING_DIR.as_uri()
+    if tracking_uri == _configured_uri:
+        return
+    mlflow.set_tracking_uri(tracking_uri)
+    if not (
+        os.environ.get("MLFLOW_EXPERIMENT_NAME")
+        or os.environ.get("MLFLOW_EXPERIMENT_ID")
+    ):
+        mlflow.set_experiment(EXPERIMENT_NAME)
+    _configured_uri = tracking_uri
+
+
+@contextmanager
+def get_run(run_name: str, optional: bool = False) -> Iterator[Optional[object]]:
+    """
+    Start an MLflow run and yield the mlflow module for logging.
+
+    mlflow is imported lazily. The run is nested under the active run when
+    there is one, otherwise it is a top-level run. With optional=True, failing
+    to import mlflow or start the run yields None instead of raising.
+    """
+    run = None
+    try:
+        import mlflow
+
+        _configure(mlflow)
+        run = mlflow.start_run(
+            run_name=run_name, nested=mlflow.active_run() is not None
+        )
+    except Exception as e:
+        if not optional:
+            raise
+        print(f"⚠️ MLflow run '{run_name}' not started: {e}")
+
+    # Yield outside the handler so errors in the caller's block are not
+    # chained onto the MLflow start-up failure
+    if run is None:
+        yield None
+        return
+
+    with run:
+        yield mlflow
+
+
+def log_files(mlflow, paths: Iterable[Path], artifact_path: str) -> None:
+    """
+    Log several files under one artifact path with a single log_artifacts call.
+
+    Files are hard-linked (or copied, across filesystems) into a staging
+    directory so the artifact store is written in one batch.
+    """
+    with tempfile.TemporaryDirectory() as staging:
+        for path in map(Path, paths):
+            target = Path(staging) / path.name
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copy2(path, target)
+        mlflow.log_artifacts(staging, artifact_path=artifact_path)
@@ -4,6 +4,8 @@ Publish generated outputs by copying them into the docs directory.
 Intended for CI/CD integration and contributor visibility.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -12,26 +14,60 @@ REPO_ROOT = Path(__file__).resolve().parent.parent
 OUTPUT_DIR = REPO_ROOT / "output"
 DOCS_DIR = REPO_ROOT / "docs"
 
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-DOCS_DIR.mkdir(parents=True, exist_ok=True)
+# Caches the pipeline keeps next to its outputs (cluster_analysis.CACHE_DIR_NAME)
+UNPUBLISHED_NAMES = frozenset({".louvain_cache"})
+
+
+def _is_current(src: Path, dest: Path) -> bool:
+    """True if dest has src's size and is at least as new (nothing to copy)."""
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        return False
+    src_stat = src.stat()
+    return (
+        dest_stat.st_size == src_stat.st_size
+        and dest_stat.st_mtime_ns >= src_stat.st_mtime_ns
+    )
+
+
+def _publish_item(item: Path, dest: Path) -> str:
+    """Copy one output file or directory to dest; returns a progress line."""
+    if item.is_file():
+        if _is_current(item, dest):
+            return f"Unchanged {dest}"
+        shutil.copyfile(item, dest)  # sendfile() on Linux
+        return f"Copied {item} → {dest}"
+    if dest.exists():
+        shutil.rmtree(dest)
+    shutil.copytree(item, dest)
+    return f"Copied directory {item} → {dest}"
 
 
 def publish_outputs(output_dir: Path = OUTPUT_DIR, docs_dir: Path = DOCS_DIR) -> None:
-    """Copy generated outputs into the docs directory for publishing."""
+    """
+    Copy generated outputs into the docs directory for publishing.
+
+    Files already published with the same size and a newer mtime are
+    skipped; the remaining copies run on a thread pool, since they spend
+    their time in copy syscalls that release the GIL.
+    """
     if not output_dir.exists():
         print(f"❌ Output directory not found: {output_dir}")
         sys.exit(1)
+    docs_dir.mkdir(parents=True, exist_ok=True)
 
-    for item in output_dir.iterdir():
-        dest = docs_dir / item.name
-        if item.is_file():
-            shutil.copy(item, dest)
-            print(f"Copied {item} → {dest}")
-        elif item.is_dir():
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(item, dest)
-            print(f"Copied directory {item} → {dest}")
+    items = [
+        item
+        for item in output_dir.iterdir()
+        if item.name not in UNPUBLISHED_NAMES and (item.is_file() or item.is_dir())
+    ]
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for line in executor.map(
+            lambda item: _publish_item(item, docs_dir / item.name), items
+        ):
+            print(line)
 
     print(f"✅ Outputs published to {docs_dir}")
 
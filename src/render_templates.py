@@ -1,7 +1,28 @@
 # src/render_templates.py
 
+import functools
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+# Compiled templates are cached here (inside the template directory)
+BYTECODE_CACHE_NAME = ".jinja_cache"
+
+
+@functools.lru_cache(maxsize=None)
+def _environment(template_dir: Path) -> Environment:
+    """
+    One Jinja2 environment per template directory, reused across calls.
+
+    Compiled templates persist in a bytecode cache between runs, and
+    auto_reload is off so loaded templates are not re-checked on each use.
+    """
+    cache_dir = template_dir / BYTECODE_CACHE_NAME
+    cache_dir.mkdir(exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(directory=str(cache_dir)),
+    )
 
 
 def render_templates(glossary, template_dir: Path, output_dir: Path):
@@ -17,14 +38,16 @@ def render_templates(glossary, template_dir: Path, output_dir: Path):
     output_dir : Path
         Directory to write rendered outputs.
     """
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
+    env = _environment(Path(template_dir).resolve())
 
-    # Render Markdown
+    # Render Markdown (streamed to disk rather than built as one string)
     md_template = env.get_template("glossary.md.j2")
-    md_output = md_template.render(entries=glossary)
-    (output_dir / "glossary.md").write_text(md_output, encoding="utf-8")
+    md_template.stream(entries=glossary).dump(
+        str(output_dir / "glossary.md"), encoding="utf-8"
+    )
 
     # Render XHTML
     xhtml_template = env.get_template("glossary.xhtml.j2")
-    xhtml_output = xhtml_template.render(entries=glossary)
-    (output_dir / "glossary.xhtml").write_text(xhtml_output, encoding="utf-8")
+    xhtml_template.stream(entries=glossary).dump(
+        str(output_dir / "glossary.xhtml"), encoding="utf-8"
+    )
@@ -6,15 +6,17 @@ Uses embeddings to cluster glossary terms, exports assignments to CSV,
 logs artifacts into MLflow, and saves a visualization.
 """
 
-import json
 import csv
-from pathlib import Path
 import sys
-import mlflow
-import matplotlib.pyplot as plt
+import matplotlib
+
+matplotlib.use("Agg")  # headless: never probe for GUI backends
+import matplotlib.pyplot as plt  # noqa: E402
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.decomposition import PCA
+from src.mlflow_ctx import get_run, log_files
+from src.utils import REPO_ROOT, load_json_cached, plots_enabled
 
 
 def run_semantic_clustering(
@@ -26,22 +28,20 @@ def run_semantic_clustering(
     Perform semantic clustering using embeddings.
     - Loads glossary JSON.
     - Generates embeddings (placeholder: random vectors for demo).
-    - Clusters with KMeans.
+    - Clusters with MiniBatchKMeans.
     - Exports assignments to CSV (default: data/semantic_cluster_assignments.csv).
     - Logs artifacts into MLflow.
     - Saves visualization into visualizations/semantic_clusters.png.
     """
 
-    repo_root = Path(__file__).resolve().parent.parent
-    glossary_path = (repo_root / glossary_json).resolve()
-    output_path = (repo_root / output_file).resolve()
+    glossary_path = (REPO_ROOT / glossary_json).resolve()
+    output_path = (REPO_ROOT / output_file).resolve()
 
     if not glossary_path.exists():
         raise FileNotFoundError(f"Glossary file not found: {glossary_path}")
 
     # Load glossary
-    with open(glossary_path, "r", encoding="utf-8") as f:
-        glossary_dict = json.load(f)
+    glossary_dict = load_json_cached(glossary_path)
 
     terms = list(glossary_dict.keys())
 
@@ -49,8 +49,15 @@ def run_semantic_clustering(
     rng = np.random.default_rng(seed=42)
     embeddings = rng.normal(size=(len(terms), 50))
 
-    # Cluster with KMeans
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+    # Cluster with mini-batch k-means (a fraction of full Lloyd's cost)
+    kmeans = MiniBatchKMeans(
+        n_clusters=n_clusters,
+        init="k-means++",
+        random_state=42,
+        batch_size=1024,
+        n_init=3,
+        max_iter=100,
+    )
     clusters = kmeans.fit_predict(embeddings)
 
     # Save assignments to CSV
@@ -58,36 +65,38 @@ def run_semantic_clustering(
     with open(output_path, "w", encoding="utf-8", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(["term", "cluster"])
-        for term, cluster in zip(terms, clusters):
-            writer.writerow([term, cluster])
+        writer.writerows(zip(terms, clusters.tolist()))
 
     print(f"✅ Semantic cluster assignments saved: {output_path}")
 
     # --- Visualization ---
-    viz_path = repo_root / "visualizations/semantic_clusters.png"
-    viz_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Reduce to 2D with PCA
-    pca = PCA(n_components=2, random_state=42)
-    reduced = pca.fit_transform(embeddings)
-
-    plt.figure(figsize=(10, 8))
-    plt.scatter(reduced[:, 0], reduced[:, 1], c=clusters, cmap=plt.cm.tab20, s=30)
-    plt.title("Semantic Clusters (PCA projection)")
-    plt.xlabel("PC1")
-    plt.ylabel("PC2")
-    plt.tight_layout()
-    plt.savefig(viz_path, dpi=300)
-    plt.close()
-    print(f"📈 Semantic cluster visualization saved: {viz_path}")
+    artifacts = [output_path]
+    if plots_enabled():
+        viz_path = REPO_ROOT / "visualizations/semantic_clusters.png"
+        viz_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Reduce to 2D with PCA
+        pca = PCA(n_components=2, random_state=42)
+        reduced = pca.fit_transform(embeddings)
+
+        plt.figure(figsize=(10, 8))
+        plt.scatter(reduced[:, 0], reduced[:, 1], c=clusters, cmap=plt.cm.tab20, s=30)
+        plt.title("Semantic Clusters (PCA projection)")
+        plt.xlabel("PC1")
+        plt.ylabel("PC2")
+        plt.tight_layout()
+        plt.savefig(viz_path, dpi=100)
+        plt.close()
+        print(f"📈 Semantic cluster visualization saved: {viz_path}")
+        artifacts.append(viz_path)
+    else:
+        print("⚠️ Skipping visualization: SKIP_PLOTS is set")
 
     # Log to MLflow
     try:
-        with mlflow.start_run(run_name="semantic_clustering", nested=True):
-            mlflow.log_artifact(str(output_path), artifact_path="semantic_clusters")
-            mlflow.log_artifact(str(viz_path), artifact_path="semantic_clusters")
-            mlflow.log_param("terms", len(terms))
-            mlflow.log_param("clusters", n_clusters)
+        with get_run("semantic_clustering") as mlflow:
+            log_files(mlflow, artifacts, "semantic_clusters")
+            mlflow.log_params({"terms": len(terms), "clusters": n_clusters})
             print("📊 Semantic clustering logged to MLflow")
     except Exception as e:
         print(f"⚠️ MLflow logging skipped: {e}")
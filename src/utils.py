@@ -4,13 +4,29 @@ Utility functions for URI-based resource resolution and glossary normalization.
 Ensures reproducible workflows across local and CI/CD environments.
 """
 
+import functools
 import json
+import os
 from pathlib import Path
+from typing import Any, Dict, Iterable, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
 
 # Assume repo layout: repo_root/{data,output,visualizations,src,notebooks}
 REPO_ROOT = Path(__file__).resolve().parent.parent
 
 
+# Base directories for the logical URI prefixes accepted by resolve_uri
+URI_PREFIXES: Dict[str, Path] = {
+    "data": REPO_ROOT / "data",
+    "output": REPO_ROOT / "output",
+    "visualizations": REPO_ROOT / "visualizations",
+}
+
+
 def resolve_uri(uri: str) -> Path:
     """
     Resolve a logical URI like 'data:aiml_glossary.json' to a filesystem path.
@@ -20,19 +36,113 @@ def resolve_uri(uri: str) -> Path:
       - output:         maps to REPO_ROOT/output
       - visualizations: maps to REPO_ROOT/visualizations
     """
-    if ":" not in uri:
+    prefix, sep, name = uri.partition(":")
+    if not sep:
         # Already a path string, return relative to repo root
         return REPO_ROOT / uri
 
-    prefix, name = uri.split(":", 1)
-    if prefix == "data":
-        return REPO_ROOT / "data" / name
-    elif prefix == "output":
-        return REPO_ROOT / "output" / name
-    elif prefix == "visualizations":
-        return REPO_ROOT / "visualizations" / name
-    else:
+    base = URI_PREFIXES.get(prefix)
+    if base is None:
         raise ValueError(f"Unknown URI prefix: {prefix}")
+    return base / name
+
+
+def plots_enabled() -> bool:
+    """
+    False when the SKIP_PLOTS environment variable is set (to anything but
+    "", "0" or "false"), letting headless runs skip figure rendering.
+    """
+    return os.environ.get("SKIP_PLOTS", "").lower() in ("", "0", "false")
+
+
+def existing_paths(paths: Iterable[Path]) -> Set[Path]:
+    """
+    Return the subset of paths that exist.
+
+    Lists each parent directory once with os.scandir instead of stat-ing
+    every path, so the cost scales with the number of directories.
+    """
+    listings: Dict[Path, Set[str]] = {}
+    found = set()
+    for path in paths:
+        parent = path.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = set()
+        if path.name in listings[parent]:
+            found.add(path)
+    return found
+
+
+def load_json(path) -> Any:
+    """
+    Parse a JSON file from disk.
+
+    Uses orjson on the raw bytes when available (no intermediate str decode),
+    falling back to the stdlib json module otherwise.
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def file_key(path) -> Tuple[str, int, int]:
+    """Cache key for an input file: resolved path, mtime (ns) and size."""
+    path = Path(path)
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def load_json_cached(path) -> Any:
+    """
+    Like load_json, but reuses the parsed document while the file's mtime
+    and size are unchanged, so pipeline stages reading the same glossary in
+    one process share a single parse.
+
+    The returned object is shared between callers and must not be mutated;
+    use load_json for a private copy.
+    """
+    return _load_json_cached(file_key(path))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(key: Tuple[str, int, int]) -> Any:
+    return load_json(key[0])
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize obj as UTF-8 JSON indented by two spaces.
+
+    Uses orjson when available, falling back to the stdlib json module.
+    Non-string dict keys are stringified as the stdlib does.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json(obj: Any, path, only_if_changed: bool = False) -> bool:
+    """
+    Write obj to path as UTF-8 JSON indented by two spaces (see dumps_json).
+
+    With only_if_changed, an existing file holding the same bytes is left
+    untouched (no rewrite, mtime preserved). Returns whether it was written.
+    """
+    path = Path(path)
+    data = dumps_json(obj)
+    if only_if_changed:
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return False
+        except OSError:
+            pass
+    path.write_bytes(data)
+    return True
 
 
 def load_glossary(uri: str) -> dict:
@@ -43,15 +153,23 @@ def load_glossary(uri: str) -> dict:
       - Dict: {"AI": "Artificial Intelligence", "ML": "Machine Learning"}
       - List: [{"term": "AI", "definition": "Artificial Intelligence"}, ...]
 
+    The normalized dict is memoized per file (path, mtime, size), so repeated
+    calls in one process skip both the parse and the list normalization.
+
     Returns:
-      dict mapping term -> definition
+      dict mapping term -> definition (a fresh copy per call, so callers may
+      add or remove terms without affecting the cache)
     """
     glossary_path = resolve_uri(uri)
     if not glossary_path.exists():
         raise FileNotFoundError(f"Glossary file not found: {glossary_path}")
 
-    with open(glossary_path, "r", encoding="utf-8") as f:
-        glossary = json.load(f)
+    return dict(_load_glossary_cached(file_key(glossary_path)))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_glossary_cached(key: Tuple[str, int, int]) -> dict:
+    glossary = _load_json_cached(key)
 
     if isinstance(glossary, dict):
         return glossary
@@ -1,8 +1,8 @@
 # src/validate_glossary.py
 
-import json
 from pathlib import Path
 import sys
+from src.utils import load_json_cached
 
 
 def validate_glossary(glossary_file: Path, schema_file: Path = None):
@@ -16,8 +16,7 @@ def validate_glossary(glossary_file: Path, schema_file: Path = None):
     if not glossary_file.exists():
         raise FileNotFoundError(f"Glossary file not found: {glossary_file}")
 
-    with open(glossary_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json_cached(glossary_file)
 
     # Handle both dict-of-entries and list-of-entries formats
     if isinstance(data, dict):
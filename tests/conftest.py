@@ -0,0 +1,29 @@
+# tests/conftest.py
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def mlflow_tracking_dir(tmp_path, monkeypatch):
+    """Keep any MLflow runs a test starts out of the repo's experiments/."""
+    tracking_dir = tmp_path / "mlruns"
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", tracking_dir.as_uri())
+    return tracking_dir
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="also run tests marked slow (e.g. matplotlib rendering)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; pass --run-slow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
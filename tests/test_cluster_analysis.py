@@ -1,21 +1,33 @@
 # tests/test_cluster_analysis.py
 
-import json
+import os
+import pytest
 import src.cluster_analysis as cluster_analysis
+from src.utils import dump_json
 
-
-def test_build_graph_creates_nodes_and_edges(tmp_path):
-    glossary = [
+GLOSSARIES = {
+    "dict": {"AI": "Artificial Intelligence", "ML": "Machine Learning"},
+    "list": [
         {"term": "AI", "definition": "Artificial Intelligence"},
         {"term": "ML", "definition": "Machine Learning"},
-    ]
-    link_dict = {"AI": ["ML"]}
+    ],
+}
+LINKS = {"AI": ["ML"]}
+
+
+@pytest.fixture(scope="session", params=sorted(GLOSSARIES))
+def glossary_files(request, tmp_path_factory):
+    """Glossary and link dictionary files, written once and only ever read."""
+    directory = tmp_path_factory.mktemp("glossary")
+    glossary_file = directory / "glossary.json"
+    link_dict_file = directory / "links.json"
+    dump_json(GLOSSARIES[request.param], glossary_file)
+    dump_json(LINKS, link_dict_file)
+    return glossary_file, link_dict_file
 
-    glossary_file = tmp_path / "glossary.json"
-    link_dict_file = tmp_path / "links.json"
 
-    glossary_file.write_text(json.dumps(glossary))
-    link_dict_file.write_text(json.dumps(link_dict))
+def test_build_graph_creates_nodes_and_edges(glossary_files):
+    glossary_file, link_dict_file = glossary_files
 
     G = cluster_analysis.build_graph(str(glossary_file), str(link_dict_file))
     assert "AI" in G.nodes
@@ -23,20 +35,27 @@ def test_build_graph_creates_nodes_and_edges(tmp_path):
     assert ("AI", "ML") in G.edges
 
 
-def test_run_clustering_creates_artifacts(tmp_path):
-    """Verify that run_clustering writes assignments, stats, and visualization."""
+def test_build_graph_from_parsed_glossaries():
+    link_dict = {"AI": ["ML", "Unknown"]}
 
-    glossary = {
-        "AI": "Artificial Intelligence",
-        "ML": "Machine Learning",
-    }
-    link_dict = {"AI": ["ML"]}
+    G_list = cluster_analysis.build_graph_from_list(
+        [{"term": "AI", "definition": "Artificial Intelligence"}, {"term": "ML"}],
+        link_dict,
+    )
+    G_dict = cluster_analysis.build_graph_from_dict(
+        {"AI": "Artificial Intelligence", "ML": "Machine Learning"}, link_dict
+    )
 
-    glossary_file = tmp_path / "glossary.json"
-    link_dict_file = tmp_path / "links.json"
+    for G in (G_list, G_dict):
+        assert list(G.nodes) == ["AI", "ML"]
+        assert list(G.edges) == [("AI", "ML")]
 
-    glossary_file.write_text(json.dumps(glossary))
-    link_dict_file.write_text(json.dumps(link_dict))
+
+def test_run_clustering_creates_artifacts(tmp_path, monkeypatch, glossary_files):
+    """Verify that run_clustering writes assignments and stats."""
+
+    monkeypatch.setenv("SKIP_PLOTS", "1")  # rendering is covered separately
+    glossary_file, link_dict_file = glossary_files
 
     assignments_path = tmp_path / "cluster_assignments.csv"
     stats_path = tmp_path / "graph_stats.json"
@@ -56,6 +75,103 @@ def test_run_clustering_creates_artifacts(tmp_path):
     assert ("AI", "ML") in G.edges
 
     # Artifacts should exist
-    assert assignments_path.exists()
-    assert stats_path.exists()
+    written = set(os.listdir(tmp_path))
+    assert {assignments_path.name, stats_path.name} <= written
+
+
+@pytest.mark.slow
+def test_run_clustering_renders_visualization(tmp_path, glossary_files):
+    """Verify that run_clustering renders the cluster plot with matplotlib."""
+
+    glossary_file, link_dict_file = glossary_files
+    viz_path = tmp_path / "glossary_clusters.png"
+
+    cluster_analysis.run_clustering(
+        str(glossary_file),
+        str(link_dict_file),
+        assignments_path=str(tmp_path / "cluster_assignments.csv"),
+        stats_path=str(tmp_path / "graph_stats.json"),
+        viz_path=str(viz_path),
+    )
+
     assert viz_path.exists()
+
+
+def test_run_clustering_reuses_cached_partition(tmp_path, monkeypatch, glossary_files):
+    glossary_file, link_dict_file = glossary_files
+    paths = [tmp_path / name for name in ("a.csv", "stats.json", "viz.svg")]
+
+    cluster_analysis.run_clustering(str(glossary_file), str(link_dict_file), *paths)
+    first = paths[0].read_text()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("partition should come from the cache")
+
+    monkeypatch.setattr(cluster_analysis, "detect_communities", fail)
+    cluster_analysis.run_clustering(str(glossary_file), str(link_dict_file), *paths)
+    assert paths[0].read_text() == first
+
+
+def test_update_communities_reclusters_only_changed_components():
+    import networkx as nx
+
+    G = nx.DiGraph()
+    for i in range(0, 40, 2):
+        G.add_edge(f"t{i}", f"t{i + 1}")
+    previous = {
+        "assignments": {node: int(node[1:]) // 2 for node in G},
+        "edges": [list(edge) for edge in G.edges()],
+    }
+
+    assert cluster_analysis.update_communities(G, previous) == previous["assignments"]
+
+    G.add_edge("t1", "t2")
+    updated = cluster_analysis.update_communities(G, previous)
+    assert set(updated.values()) == set(range(len(set(updated.values()))))
+    for i in range(4, 40, 2):
+        assert updated[f"t{i}"] == updated[f"t{i + 1}"]
+        assert updated[f"t{i}"] not in (updated["t0"], updated["t3"])
+
+    G.add_edges_from((f"t{i}", f"t{i + 3}") for i in range(0, 36, 2))
+    assert cluster_analysis.update_communities(G, previous) is None
+
+
+def test_detect_communities_restores_igraph_rng(glossary_files):
+    igraph = pytest.importorskip("igraph")
+    import random
+
+    cluster_analysis.detect_communities(cluster_analysis.build_graph(*glossary_files))
+
+    # igraph draws from the stdlib random module again, not a leftover seed
+    random.seed(0)
+    first = igraph.Graph.Erdos_Renyi(20, 0.3).get_edgelist()
+    random.seed(0)
+    assert igraph.Graph.Erdos_Renyi(20, 0.3).get_edgelist() == first
+
+
+def test_svg_and_raster_share_cluster_colours(tmp_path, monkeypatch):
+    import re
+    import networkx as nx
+
+    G = nx.DiGraph()
+    G.add_nodes_from(f"t{i}" for i in range(21))
+    assignments = {node: i for i, node in enumerate(G)}
+    pos = {node: (float(i), 0.0) for i, node in enumerate(G)}
+
+    svg_path = tmp_path / "viz.svg"
+    cluster_analysis.visualize_graph(G, str(svg_path), assignments=assignments, pos=pos)
+    svg_fills = re.findall(r'fill="(#[0-9a-f]{6})"', svg_path.read_text())
+
+    drawn = {}
+    draw_nodes = nx.draw_networkx_nodes
+    monkeypatch.setattr(
+        nx,
+        "draw_networkx_nodes",
+        lambda *args, **kwargs: drawn.update(kwargs) or draw_nodes(*args, **kwargs),
+    )
+    png_path = tmp_path / "viz.png"
+    cluster_analysis.visualize_graph(G, str(png_path), assignments=assignments, pos=pos)
+
+    assert drawn["node_color"] == svg_fills
+    assert len(set(svg_fills[:20])) == 20  # clusters 10-19 get their own colours
+    assert svg_fills[20] == svg_fills[0]
@@ -0,0 +1,30 @@
+# tests/test_clustering.py
+
+import inspect
+import src.clustering as clustering
+from src.utils import dump_json
+
+
+def test_run_pipeline_passes_each_stage_valid_arguments(tmp_path, monkeypatch):
+    glossary_file = tmp_path / "glossary.json"
+    link_dict_file = tmp_path / "links.json"
+    dump_json({"AI": "Artificial Intelligence"}, glossary_file)
+    dump_json({"AI": []}, link_dict_file)
+
+    calls = []
+    for name in ("run_clustering", "run_semantic_clustering", "evaluate_clusters"):
+        stage = getattr(clustering, name)
+        monkeypatch.setattr(
+            clustering,
+            name,
+            lambda *args, _stage=stage, **kwargs: calls.append(
+                inspect.signature(_stage).bind(*args, **kwargs).arguments
+            ),
+        )
+
+    clustering.run_pipeline(str(glossary_file), str(link_dict_file), num_clusters=3)
+
+    graph, semantic, _ = calls
+    assert graph["glossary_json"] == str(glossary_file)
+    assert graph["assignments_path"].endswith("cluster_assignments.csv")
+    assert semantic["n_clusters"] == 3
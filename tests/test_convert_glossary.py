@@ -0,0 +1,18 @@
+# tests/test_convert_glossary.py
+
+import src.convert_glossary as convert_glossary
+from src.utils import load_json
+
+
+def test_convert_glossary_plain_lines(tmp_path):
+    markdown_file = tmp_path / "glossary.md"
+    json_file = tmp_path / "glossary.json"
+    markdown_file.write_text("AI: Artificial Intelligence\nML: Machine Learning\n")
+
+    entries = convert_glossary.convert_glossary(markdown_file, json_file)
+
+    assert entries == [
+        {"term": "AI", "definition": "Artificial Intelligence"},
+        {"term": "ML", "definition": "Machine Learning"},
+    ]
+    assert load_json(json_file) == entries
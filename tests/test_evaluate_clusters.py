@@ -0,0 +1,22 @@
+# tests/test_evaluate_clusters.py
+
+import src.evaluate_clusters as evaluate_clusters
+from src.utils import load_json
+
+
+def test_evaluate_clusters_accepts_string_labels(tmp_path, monkeypatch):
+    monkeypatch.setattr(evaluate_clusters, "REPO_ROOT", tmp_path)
+    graph_file = tmp_path / "graph.csv"
+    semantic_file = tmp_path / "semantic.csv"
+    graph_file.write_text("term,cluster\nAI,a\nML,a\nDL,b\nRL,\n")
+    semantic_file.write_text("term,cluster\nAI,a\nML,a\nDL,c\nRL,\n")
+
+    metrics = evaluate_clusters.evaluate_clusters(str(graph_file), str(semantic_file))
+
+    assert metrics["graph_stats"] == {
+        "total_terms": 4,
+        "agreements": 3,
+        "agreement_ratio": 0.75,
+    }
+    assert metrics["ari_metrics"]["adjusted_rand_index"] == 1.0
+    assert load_json(tmp_path / "data/graph_stats.json") == metrics["graph_stats"]
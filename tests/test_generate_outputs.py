@@ -0,0 +1,43 @@
+# tests/test_generate_outputs.py
+
+import pytest
+import src.generate_outputs as generate_outputs
+from src.utils import dump_json, load_json
+
+GLOSSARY = {
+    "ai": {"term": "AI", "definition": "Artificial Intelligence, broadly."},
+    "ml": {"term": "ML", "definition": "Machine Learning", "tags": ["ai"]},
+}
+
+
+@pytest.fixture(params=["ijson", "load_json"])
+def reader(request, monkeypatch):
+    """Run each test with the streaming reader and with the full parse."""
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(generate_outputs, "ijson", None)
+    return request.param
+
+
+def test_generate_copies_dict_glossary(tmp_path, reader):
+    glossary_file = tmp_path / "glossary.json"
+    dump_json(GLOSSARY, glossary_file)
+
+    generate_outputs.generate(str(glossary_file), str(tmp_path / "out"))
+
+    assert load_json(tmp_path / "out/glossary_copy.json") == GLOSSARY
+    rows = (tmp_path / "out/terms.csv").read_text().splitlines()
+    assert rows[1:] == [
+        'ai,AI,"Artificial Intelligence, broadly.",,,,,',
+        "ml,ML,Machine Learning,ai,,,,",
+    ]
+
+
+def test_generate_rejects_list_glossary(tmp_path, reader):
+    glossary_file = tmp_path / "glossary.json"
+    dump_json([{"term": "AI", "definition": "Artificial Intelligence"}], glossary_file)
+
+    with pytest.raises(ValueError, match="Unsupported glossary format"):
+        generate_outputs.generate(str(glossary_file), str(tmp_path / "out"))
+    assert not list((tmp_path / "out").iterdir())
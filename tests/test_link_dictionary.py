@@ -0,0 +1,88 @@
+# tests/test_link_dictionary.py
+
+import src.link_dictionary as link_dictionary
+from src.utils import dump_json, load_json
+
+# Overlapping terms, case-folded duplicates, an empty term, a slug-only
+# entry and non-ASCII terms, in an order the link lists must preserve
+GLOSSARY = {
+    "ml": {"term": "Machine Learning", "definition": "A field of AI, trained on data."},
+    "ai": {
+        "term": "AI",
+        "definition": "Artificial intelligence, including machine learning.",
+    },
+    "ai-lower": {"term": "ai", "definition": "Lowercase duplicate of AI."},
+    "dl": {"term": "Deep Learning", "definition": "Machine learning with deep nets."},
+    "learning": {"term": "Learning", "definition": "As in deep learning."},
+    "empty": {"term": "", "definition": "An entry with an empty term."},
+    "slug": {"definition": "Uses its slug as term."},
+    # "é" and "i" share a character-mask bit (code points 233 and 105)
+    "cafe": {"term": "Café", "definition": "Where AI meetups happen."},
+    "shop": {"term": "Coffee Shop", "definition": "A café by another name."},
+    "typo": {"term": "Typo", "definition": "Writing cafi for a coffee shop."},
+}
+
+
+def naive_links(glossary):
+    """The original scan: every term against every definition."""
+    terms = [entry.get("term", slug) for slug, entry in glossary.items()]
+    link_dict = {t: [] for t in terms}
+    for slug, entry in glossary.items():
+        term = entry.get("term", slug)
+        definition_text = entry.get("definition", "")
+        for other in terms:
+            if other != term and other.lower() in definition_text.lower():
+                link_dict[term].append(other)
+    return link_dict
+
+
+def build_links(tmp_path, glossary=GLOSSARY):
+    glossary_file = tmp_path / "glossary.json"
+    output_file = tmp_path / "links.json"
+    dump_json(glossary, glossary_file)
+    link_dict = link_dictionary.build_link_dictionary(
+        str(glossary_file), str(output_file)
+    )
+    assert load_json(output_file) == link_dict
+    return link_dict
+
+
+def test_build_link_dictionary_matches_naive_scan(tmp_path):
+    assert build_links(tmp_path) == naive_links(GLOSSARY)
+
+
+def test_word_boundaries_match_whole_words_only():
+    matches = link_dictionary._term_matcher(
+        ["AI", "Neural Network", "K-Means"], word_boundaries=True
+    )
+
+    assert matches("models that ai systems train") == {0}
+    assert matches("we train models") == set()
+    assert matches("a neural network.") == {1}
+    assert matches("neural networks") == set()
+    assert matches("k-means clustering") == {2}
+    assert matches("k means clustering") == {2}
+    assert matches("k-meansx clustering") == set()
+
+
+def test_word_boundaries_keep_punctuated_terms_apart():
+    matches = link_dictionary._term_matcher(["C++", "C#", ""], word_boundaries=True)
+
+    assert matches("written in c#") == {1}
+    assert matches("a (c++) library") == {0}
+    assert matches("abc++ and c#x") == set()
+    assert matches("plain c code") == set()
+
+
+def test_build_link_dictionary_parallel_matches_serial(tmp_path, monkeypatch):
+    serial = build_links(tmp_path)
+
+    monkeypatch.setattr(link_dictionary, "PARALLEL_MIN_ENTRIES", 2)
+    monkeypatch.setattr(link_dictionary, "_CHUNK_SIZE", 3)
+    monkeypatch.setattr(link_dictionary.os, "cpu_count", lambda: 2)
+    assert build_links(tmp_path) == serial
+
+
+def test_build_link_dictionary_without_ahocorasick(tmp_path, monkeypatch):
+    monkeypatch.setattr(link_dictionary, "ahocorasick", None)
+    assert build_links(tmp_path) == naive_links(GLOSSARY)
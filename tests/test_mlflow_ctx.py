@@ -0,0 +1,44 @@
+# tests/test_mlflow_ctx.py
+
+import sys
+import types
+import pytest
+import src.mlflow_ctx as mlflow_ctx
+
+
+def fake_mlflow(calls):
+    return types.SimpleNamespace(
+        set_tracking_uri=lambda uri: calls.append(("uri", uri)),
+        set_experiment=lambda name: calls.append(("experiment", name)),
+    )
+
+
+def test_configure_respects_and_follows_tracking_uri(tmp_path, monkeypatch):
+    monkeypatch.setattr(mlflow_ctx, "_configured_uri", None)
+    calls = []
+    mlflow = fake_mlflow(calls)
+
+    mlflow_ctx._configure(mlflow)
+    mlflow_ctx._configure(mlflow)
+    first = (tmp_path / "mlruns").as_uri()
+    assert calls == [("uri", first), ("experiment", mlflow_ctx.EXPERIMENT_NAME)]
+
+    other = (tmp_path / "other").as_uri()
+    monkeypatch.setenv("MLFLOW_TRACKING_URI", other)
+    mlflow_ctx._configure(mlflow)
+    assert calls[2:] == [("uri", other), ("experiment", mlflow_ctx.EXPERIMENT_NAME)]
+
+
+def test_optional_run_does_not_chain_caller_errors(monkeypatch):
+    def fail(**kwargs):
+        raise RuntimeError("tracking server down")
+
+    mlflow = types.SimpleNamespace(active_run=lambda: None, start_run=fail)
+    monkeypatch.setitem(sys.modules, "mlflow", mlflow)
+    monkeypatch.setattr(mlflow_ctx, "_configure", lambda mlflow: None)
+
+    with pytest.raises(ValueError) as excinfo:
+        with mlflow_ctx.get_run("stage", optional=True) as run:
+            assert run is None
+            raise ValueError("caller bug")
+    assert excinfo.value.__context__ is None
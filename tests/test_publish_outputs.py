@@ -0,0 +1,24 @@
+# tests/test_publish_outputs.py
+
+from src.publish_outputs import publish_outputs
+
+
+def test_publish_outputs_copies_dotfiles_but_not_caches(tmp_path):
+    output_dir = tmp_path / "output"
+    docs_dir = tmp_path / "docs"
+    (output_dir / ".well-known").mkdir(parents=True)
+    (output_dir / ".louvain_cache").mkdir()
+    (output_dir / ".nojekyll").write_text("")
+    (output_dir / ".well-known" / "security.txt").write_text("contact")
+    (output_dir / ".louvain_cache" / "partition.json").write_text("{}")
+    (output_dir / "graph_stats.json").write_text("{}")
+
+    publish_outputs(output_dir, docs_dir)
+
+    published = sorted(p.relative_to(docs_dir).as_posix() for p in docs_dir.rglob("*"))
+    assert published == [
+        ".nojekyll",
+        ".well-known",
+        ".well-known/security.txt",
+        "graph_stats.json",
+    ]
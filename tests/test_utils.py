@@ -0,0 +1,14 @@
+# tests/test_utils.py
+
+from src.utils import dump_json, load_glossary
+
+
+def test_load_glossary_copies_are_independent(tmp_path):
+    glossary_file = tmp_path / "glossary.json"
+    dump_json([{"term": "AI", "definition": "Artificial Intelligence"}], glossary_file)
+
+    glossary = load_glossary(str(glossary_file))
+    glossary["ML"] = "Machine Learning"
+    del glossary["AI"]
+
+    assert load_glossary(str(glossary_file)) == {"AI": "Artificial Intelligence"}
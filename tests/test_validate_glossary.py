@@ -7,60 +7,74 @@ These tests enforce the canonical schema:
 - Optional metadata fields (id, examples, tags, etc.) are also validated.
 """
 
-import json
 from pathlib import Path
+import pytest
+from src.utils import load_json  # orjson-backed, stdlib fallback
 
 DATA_DIR = Path("data")
 GLOSSARY_FILE = DATA_DIR / "aiml_glossary.json"
 
 
-def load_json(path: Path):
-    with path.open(encoding="utf-8") as f:
-        return json.load(f)
+# Parsed once at collection time so per-entry tests can be parametrized
+GLOSSARY = load_json(GLOSSARY_FILE) if GLOSSARY_FILE.exists() else {}
+ENTRIES = GLOSSARY if isinstance(GLOSSARY, dict) else {}
 
+# One test item per entry: failures are reported individually and
+# pytest-xdist can spread the entries across workers
+each_entry = pytest.mark.parametrize(
+    "term,entry", list(ENTRIES.items()), ids=list(ENTRIES)
+)
 
-def test_glossary_exists() -> None:
+
+@pytest.fixture(scope="session")
+def glossary():
+    """The canonical glossary, shared by every test."""
+    assert GLOSSARY_FILE.exists(), "Glossary file missing"
+    return GLOSSARY
+
+
+def test_glossary_exists(glossary) -> None:
     """Glossary JSON file should exist and be non-empty dict."""
     assert GLOSSARY_FILE.exists(), "Glossary file missing"
-    glossary = load_json(GLOSSARY_FILE)
     assert isinstance(glossary, dict), "Glossary should be a dict"
     assert glossary, "Glossary dict should not be empty"
 
 
-def test_terms_have_definitions() -> None:
+@each_entry
+def test_terms_have_definitions(term, entry) -> None:
     """Every glossary entry should have a non-empty definition string."""
-    glossary = load_json(GLOSSARY_FILE)
-    for term, entry in glossary.items():
-        assert isinstance(entry, dict), f"{term} should be a dict entry"
-        definition = entry.get("definition")
-        assert isinstance(definition, str), f"Definition for {term} should be a string"
-        assert definition.strip(), f"Definition for {term} should not be empty"
+    assert isinstance(entry, dict), f"{term} should be a dict entry"
+    definition = entry.get("definition")
+    assert isinstance(definition, str), f"Definition for {term} should be a string"
+    assert definition.strip(), f"Definition for {term} should not be empty"
 
 
-def test_ids_are_unique() -> None:
+def test_ids_are_unique(glossary) -> None:
     """If entries have 'id' fields, they should be unique."""
-    glossary = load_json(GLOSSARY_FILE)
-    ids = [
-        entry.get("id") for entry in glossary.values() if entry.get("id") is not None
-    ]
-    assert len(ids) == len(set(ids)), "Duplicate IDs found in glossary"
+    seen = set()
+    for entry in glossary.values():
+        entry_id = entry.get("id")
+        if entry_id is None:
+            continue
+        if entry_id in seen:
+            pytest.fail(f"Duplicate ID found in glossary: {entry_id}")
+        seen.add(entry_id)
 
 
-def test_optional_metadata_types() -> None:
+@each_entry
+def test_optional_metadata_types(term, entry) -> None:
     """Optional metadata fields should have expected types."""
-    glossary = load_json(GLOSSARY_FILE)
-    for term, entry in glossary.items():
-        if "examples" in entry:
-            assert isinstance(
-                entry["examples"], list
-            ), f"Examples for {term} should be a list"
-        if "tags" in entry:
-            assert isinstance(entry["tags"], list), f"Tags for {term} should be a list"
-        if "related_terms" in entry:
-            assert isinstance(
-                entry["related_terms"], list
-            ), f"Related terms for {term} should be a list"
-        if "last_updated" in entry:
-            assert isinstance(
-                entry["last_updated"], str
-            ), f"last_updated for {term} should be a string"
+    if "examples" in entry:
+        assert isinstance(
+            entry["examples"], list
+        ), f"Examples for {term} should be a list"
+    if "tags" in entry:
+        assert isinstance(entry["tags"], list), f"Tags for {term} should be a list"
+    if "related_terms" in entry:
+        assert isinstance(
+            entry["related_terms"], list
+        ), f"Related terms for {term} should be a list"
+    if "last_updated" in entry:
+        assert isinstance(
+            entry["last_updated"], str
+        ), f"last_updated for {term} should be a string"